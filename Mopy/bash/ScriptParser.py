@@ -62,8 +62,10 @@
 #==================================================
 import operator
 import os
+import threading
 from collections import defaultdict
 from string import digits, whitespace
+from zlib import crc32
 
 from . import bolt # no other Bash imports!
 from .bolt import FName
@@ -185,6 +187,10 @@ class OP(object):
          CLOSE_BRACKET:u'CLOSE_BRACKET',
          COLON:u'COLON',
 }
+# Token types whose type can change while a script runs (a name becomes a
+# variable once it is assigned to), so they have to be resolved again when
+# reusing compiled tokens
+_NAME_TYPES = {NAME, VARIABLE}
 
 # FlowControl -------------------------------------
 #  Flow control object, to hold info about a flow
@@ -209,9 +215,16 @@ def __init__(self, statement_type, active, keywords=[], **attribs):
 #--------------------------------------------------
 ##: Refactor to use exception.ParserError instead?
 class ParserError(SyntaxError): pass
-gParser: Parser | None = None
+# Each thread tracks its own active parser, so that wizards may be evaluated
+# concurrently (e.g. when running auto-wizards in the background)
+_parser_state = threading.local()
+
+def _active_parser() -> Parser | None:
+    """Return the parser that was most recently created on this thread."""
+    return getattr(_parser_state, 'parser', None)
+
 def error(msg):
-    if gParser:
+    if gParser := _active_parser():
         raise ParserError(
             f'(Line {gParser.cLine}, Column {gParser.cCol}): {msg}')
     else:
@@ -314,6 +327,7 @@ def __init__(self, keyword_name, function, min_args=0, max_args=KEY.NA,
                              passTokens, passCommas)
 
         def __call__(self, *args):
+            gParser = _active_parser()
             gParser.StripOuterParens(args)
             if not self.splitCommas:
                 return super().__call__(*args)
@@ -470,6 +484,9 @@ def __init__(self,
 
         self.word = None
         self.wordStart = None
+        # Compiled forms of the script - see RunLine and TokensToRPN
+        self._compiled_lines = {}
+        self._compiled_rpns = {}
 
         if dotOperator:
             self.SetOperator(dotOperator, self.opDotOperator, OP.PAR)
@@ -477,8 +494,7 @@ def __init__(self,
         self.functions[u']index['] = Parser.Function(u'<index>', self.fnIndex,
                                                      2, 4)
 
-        global gParser
-        gParser = self
+        _parser_state.parser = self
 
     # Dummy function for the dot operator
     def opDotOperator(self, l, r): pass
@@ -552,14 +568,30 @@ def PurgeFlow(self): self.Flow = []
     # Run a line of code: returns True if more lines are needed to make a complete line, False if not
     def RunLine(self, line):
         # First reset tokens if we're starting a new line
-        if not self.runon:
+        new_line = not self.runon
+        if new_line:
             self.cLineStart = self.cLine
             self.tokens = []
 
-        # Now parse the tokens
+        # Now parse the tokens - complete lines are only tokenized once, after
+        # that we reuse their compiled tokens (loops run lines many times)
         self.cLine += 1
-        self.TokenizeLine(line)
-        if self.runon: return True
+        if new_line and (compiled := self._compiled_lines.get(
+                line)) is not None:
+            if not compiled: return False
+            # Skip inactive lines without even building their tokens
+            if self.LenFlow() > 0:
+                i = self.PeekFlow()
+                if not i.active and compiled[0][0] not in i.keywords:
+                    return False
+            self.cCol = len(line)
+            self.tokens = self._load_tokens(compiled)
+        else:
+            self.TokenizeLine(line)
+            if self.runon: return True
+            if new_line:
+                self._compiled_lines[line] = tuple(
+                    [(t.text, t.type, t.pos) for t in self.tokens])
 
         # No tokens?
         if len(self.tokens) == 0: return False
@@ -580,6 +612,13 @@ def RunLine(self, line):
             self.ExecuteTokens()
         return False
 
+    def _load_tokens(self, compiled):
+        """Create fresh tokens for the current line from its compiled form."""
+        variables = self.variables
+        return [Parser.Token(t_text, ((VARIABLE if t_text in variables else
+            NAME) if t_type in _NAME_TYPES else t_type), self, self.cLine,
+            t_pos) for t_text, t_type, t_pos in compiled]
+
     # Removes any commas from a list of tokens
     def SkipCommas(self, tokens=None):
         if tokens is None:
@@ -640,9 +679,44 @@ def ExecuteTokens(self, tokens=None):
         self.TokensToRPN(list(tokens))
         return self.ExecuteRPN()
 
-    # Convert a list of tokens to rpn
+    # Convert a list of tokens to rpn - the conversion only depends on the
+    # text and (static) type of the tokens, so it is done once per expression
+    # and then replayed onto the tokens
     def TokensToRPN(self, tokens=None):
         tokens = tokens or self.tokens
+        rpn_key = None
+        if all(t.parser is self for t in tokens):
+            try:
+                rpn_key = tuple([(t.text, NAME if t.type in _NAME_TYPES else
+                                  t.type) for t in tokens])
+            except TypeError: # unhashable token contents, don't cache
+                pass
+            else:
+                compiled_rpn = self._compiled_rpns.get(rpn_key)
+                if compiled_rpn is not None:
+                    self.rpn = self._load_rpn(tokens, compiled_rpn)
+                    return self.rpn
+        rpn = self._tokens_to_rpn(tokens)
+        if rpn_key is not None:
+            token_dexes = {id(t): j for j, t in enumerate(tokens)}
+            self._compiled_rpns[rpn_key] = tuple([
+                (token_dexes[id(t)], None, t.numArgs) if id(t) in token_dexes
+                else (t.text, t.type, t.numArgs) for t in rpn])
+        return rpn
+
+    def _load_rpn(self, tokens, compiled_rpn):
+        """Rebuild the RPN of tokens from its compiled form."""
+        rpn = []
+        for rpn_entry, t_type, num_args in compiled_rpn:
+            if t_type is None: # one of the input tokens
+                tok = tokens[rpn_entry]
+            else: # inserted during the conversion
+                tok = Parser.Token(rpn_entry, t_type, self)
+            tok.numArgs = num_args
+            rpn.append(tok)
+        return rpn
+
+    def _tokens_to_rpn(self, tokens):
         rpn = []
         stack = []
 
@@ -947,6 +1021,12 @@ def _stateEndBracket(self, c):
         return self._stateSpace(c)
 
 class PreParser(Parser):
+    # Maps the CRCs of wizard scripts to their compiled lines and RPNs, so
+    # that running a wizard again does not have to compile it again
+    _compiled_scripts: dict[int, tuple[dict, dict]] = {}
+    _max_compiled_scripts = 32
+    _compiled_scripts_lock = threading.Lock()
+
     def __init__(self):
         super().__init__()
         #--Constants
@@ -1525,7 +1605,6 @@ def kwdNote(self, note):
     def Begin(self, wizard_file, wizard_dir):
         self._reset_vars()
         self.cLine = 0
-        self.reversing = 0
         self.ExecCount = 0
         self._wizard_dir = wizard_dir
         try:
@@ -1533,6 +1612,8 @@ def Begin(self, wizard_file, wizard_dir):
                 # Ensure \n line endings for the script parser
                 self.lines = [bolt.to_unix_newlines(x)
                               for x in wiz_script.readlines()]
+            self._use_compiled_script(
+                crc32(''.join(self.lines).encode('utf-8')))
             return None
         except UnicodeError:
             return _('Could not read the wizard file. Please ensure it is '
@@ -1540,6 +1621,21 @@ def Begin(self, wizard_file, wizard_dir):
         except OSError:
             return _('Could not open the wizard file.')
 
+    def _use_compiled_script(self, script_crc):
+        """Share the compiled form of the script with that CRC with all other
+        parsers that run it."""
+        compiled = PreParser._compiled_scripts
+        with PreParser._compiled_scripts_lock:
+            try:
+                # Move it to the end, so that the oldest scripts get dropped
+                # first
+                compiled[script_crc] = compiled.pop(script_crc)
+            except KeyError:
+                compiled[script_crc] = ({}, {})
+                if len(compiled) > self._max_compiled_scripts:
+                    del compiled[next(iter(compiled))]
+            self._compiled_lines, self._compiled_rpns = compiled[script_crc]
+
     def _reset_vars(self):
         self.variables.clear()
         self.Flow = []
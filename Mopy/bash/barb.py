@@ -34,11 +34,20 @@
 the settings were created with
 - bass.AppVersion, saved second, is the version of Bash currently executing
 the backup
+
+Besides 7z archives, settings can be backed up incrementally: each backup is
+then a small manifest (see _incremental_ext) listing the chunks its files are
+made of, while the chunks themselves are stored, compressed and keyed on their
+hash, in a folder shared by all incremental backups in the same directory (see
+_chunks_dir_name). Files that did not change since the last backup are thus
+only stored once.
 """
 
+import hashlib
 import os
 import pickle
 import tempfile
+import zlib
 from os.path import join as jo
 
 from . import archives, bolt, initialization
@@ -48,6 +57,11 @@
 from .exception import BoltError, StateError
 from .wbtemp import TempDir
 
+_incremental_ext = '.wbbak'
+_chunks_dir_name = 'Backup Chunks'
+_chunk_size = 4 * 1024 * 1024 # 4 MiB
+_manifest_version = 1
+
 def _init_settings_files(bak_name, mg_name, root_prefix, mods_folder):
     """Construct a dict mapping directory paths to setting files. Keys are
     tuples of absolute paths to directories, paired with the relative paths
@@ -148,12 +162,24 @@ def backup_filename(bak_name):
         return f'Backup Bash Settings {bak_name} ({bolt.timestamp()}) v' \
                f'{bass.settings[u"bash.version"]}-{AppVersion}.7z'
 
+    @staticmethod
+    def backup_wildcard():
+        """Return the wildcard for file dialogs asking where to create a
+        backup - the chosen filter decides the format of the backup."""
+        return '|'.join([f"{_('7z Archive')} (*.7z)", '*.7z',
+                         f"{_('Incremental Backup')} (*{_incremental_ext})",
+                         f'*{_incremental_ext}'])
+
     def backup_settings(self, balt_):
         deprint(u'')
         deprint(f'BACKUP BASH SETTINGS: {self._backup_dest_file}')
-        with TempDir() as temp_settings_backup_dir:
-            self._backup_settings(GPath_no_norm(temp_settings_backup_dir))
-            self._backup_success(balt_)
+        if self._backup_dest_file.cext == _incremental_ext:
+            self._backup_incremental()
+        else:
+            with TempDir() as temp_settings_backup_dir:
+                self._backup_settings(GPath_no_norm(temp_settings_backup_dir))
+        bass.settings[u'bash.backupPath'] = self._backup_dest_file.head
+        self._backup_success(balt_)
 
     def _backup_settings(self, temp_dir):
         # copy all files to ~tmp backup dir
@@ -162,16 +188,37 @@ def _backup_settings(self, temp_dir):
             fpath.copyTo(temp_dir.join(tpath))
         # dump the version info and file listing
         with temp_dir.join(u'backup.dat').open(u'wb') as out:
-            # Bash version the settings were saved with, if this is newer
-            # than the installed settings version, do not allow restore
-            pickle.dump(bass.settings[u'bash.version'], out, -1)
-            # app version, if this doesn't match the installed settings
-            # version, warn the user on restore
-            pickle.dump(AppVersion, out, -1)
+            out.write(self._backup_dat())
         # create the backup archive in 7z format WITH solid compression
         # may raise StateError
         archives.compress7z(self._backup_dest_file, temp_dir)
-        bass.settings[u'bash.backupPath'] = self._backup_dest_file.head
+
+    def _backup_incremental(self):
+        chunk_store = _ChunkStore(self._backup_dest_file.head)
+        try:
+            manifest_files = {'backup.dat': chunk_store.add_bytes(
+                self._backup_dat())}
+            for tpath, fpath in self.files.items():
+                deprint(f'{tpath} <-- {fpath}')
+                manifest_files[_manifest_key(tpath)] = chunk_store.add_file(
+                    fpath)
+            _write_manifest(self._backup_dest_file, manifest_files)
+            # Drop the chunks of backups that have been deleted
+            chunk_store.prune()
+        except OSError as e:
+            raise StateError(f'Failed to create incremental backup '
+                             f'{self._backup_dest_file}: {e}') from e
+
+    @staticmethod
+    def _backup_dat():
+        """Return the contents of backup.dat, which stores the versions of
+        the backed up settings."""
+        # Bash version the settings were saved with, if this is newer than
+        # the installed settings version, do not allow restore
+        settings_version = pickle.dumps(bass.settings[u'bash.version'], -1)
+        # app version, if this doesn't match the installed settings version,
+        # warn the user on restore
+        return settings_version + pickle.dumps(AppVersion, -1)
 
     def _backup_success(self, balt_):
         if balt_ is None: return
@@ -191,8 +238,105 @@ def warn_message(balt_):
 
 def is_backup(backup_path):
     """Return True if the specified path is a backup. Currently only
-    checks if the file extension is 7z."""
-    return backup_path.fn_ext == u'.7z'
+    checks if the file extension is 7z or that of incremental backups."""
+    return backup_path.fn_ext in ('.7z', _incremental_ext)
+
+#------------------------------------------------------------------------------
+def _manifest_key(rel_path):
+    # Always use forward slashes, so that the backup can be restored on any OS
+    return rel_path.s.replace(os.sep, '/')
+
+def _write_manifest(manifest_path, manifest_files):
+    """Write the manifest of an incremental backup, which maps the relative
+    paths of the backed up files to the hashes of their chunks."""
+    temp_path = f'{manifest_path}.tmp'
+    with open(temp_path, 'wb') as out:
+        pickle.dump({'version': _manifest_version, 'files': manifest_files},
+                    out, -1)
+    os.replace(temp_path, manifest_path)
+
+def _read_manifest(manifest_path):
+    try:
+        with open(manifest_path, 'rb') as ins:
+            manifest = pickle.load(ins)
+        if manifest['version'] > _manifest_version:
+            raise BoltError(f'{manifest_path} was created by a newer '
+                            f'version of Wrye Bash')
+        return manifest['files']
+    except (OSError, pickle.UnpicklingError, EOFError, KeyError,
+            TypeError) as e:
+        raise BoltError(f'Failed to read {manifest_path}') from e
+
+class _ChunkStore(object):
+    """Content-addressed store of the zlib-compressed chunks that the files
+    of incremental backups are split into. Shared by all incremental backups
+    in the same directory."""
+
+    def __init__(self, backup_dir):
+        self._backup_dir = backup_dir
+        self._chunks_dir = backup_dir.join(_chunks_dir_name)
+
+    def _chunk_path(self, chunk_hash):
+        return self._chunks_dir.join(chunk_hash[:2], chunk_hash)
+
+    def add_bytes(self, file_data):
+        """Store the specified data, returning the hashes of its chunks."""
+        return [self._add_chunk(file_data[i:i + _chunk_size])
+                for i in range(0, len(file_data), _chunk_size)]
+
+    def add_file(self, file_path):
+        """Store the contents of the specified file, returning the hashes of
+        its chunks."""
+        chunk_hashes = []
+        with file_path.open('rb') as ins:
+            while chunk := ins.read(_chunk_size):
+                chunk_hashes.append(self._add_chunk(chunk))
+        return chunk_hashes
+
+    def _add_chunk(self, chunk):
+        chunk_hash = hashlib.sha256(chunk).hexdigest()
+        chunk_path = self._chunk_path(chunk_hash)
+        if not chunk_path.exists(): # otherwise it's already backed up
+            chunk_path.head.makedirs()
+            temp_path = f'{chunk_path}.tmp'
+            with open(temp_path, 'wb') as out:
+                out.write(zlib.compress(chunk))
+            os.replace(temp_path, chunk_path)
+        return chunk_hash
+
+    def restore(self, manifest_path, dest_dir):
+        """Reassemble the files of the specified incremental backup in
+        dest_dir."""
+        for rel_path, chunk_hashes in _read_manifest(manifest_path).items():
+            dest_path = dest_dir.join(*rel_path.split('/'))
+            try:
+                dest_path.head.makedirs()
+                with dest_path.open('wb') as out:
+                    for chunk_hash in chunk_hashes:
+                        with self._chunk_path(chunk_hash).open('rb') as ins:
+                            out.write(zlib.decompress(ins.read()))
+            except (OSError, zlib.error) as e:
+                raise BoltError(f'Failed to restore {rel_path} from '
+                                f'{manifest_path}') from e
+
+    def prune(self):
+        """Remove all chunks that are not used by any of the incremental
+        backups in the backup directory."""
+        used_hashes = set()
+        for manifest_name in self._backup_dir.ilist():
+            if manifest_name.fn_ext != _incremental_ext: continue
+            try:
+                manifest_files = _read_manifest(
+                    self._backup_dir.join(manifest_name))
+            except BoltError:
+                deprint(f'Not pruning {self._chunks_dir}', traceback=True)
+                return # better keep some unused chunks than lose a backup
+            for chunk_hashes in manifest_files.values():
+                used_hashes.update(chunk_hashes)
+        for chunk_root, _dirs, chunk_names in os.walk(self._chunks_dir):
+            for chunk_name in chunk_names:
+                if chunk_name not in used_hashes:
+                    os.remove(jo(chunk_root, chunk_name))
 
 #------------------------------------------------------------------------------
 class RestoreSettings(object):
@@ -223,7 +367,11 @@ def extract_backup(self):
             # restart of WB, which wbtemp by design cannot do
             self._extract_dir = GPath_no_norm(tempfile.mkdtemp(
                 prefix=RestoreSettings.__tmpdir_prefix))
-            archives.extract7z(self._settings_file, self._extract_dir)
+            if self._settings_file.cext == _incremental_ext:
+                _ChunkStore(self._settings_file.head).restore(
+                    self._settings_file, self._extract_dir)
+            else:
+                archives.extract7z(self._settings_file, self._extract_dir)
         elif self._settings_file.is_dir():
             self._extract_dir = self._settings_file
         else:
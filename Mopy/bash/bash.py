@@ -669,7 +669,9 @@ def _main(opts, wx_locale, wxver):
             bkf = barb.BackupSettings.backup_filename(bush_game.bak_game_name)
             settings_file = gui.FileSave.display_dialog(
                 frame, title=_('Backup Wrye Bash Settings'),
-                defaultDir=base_dir, wildcard='*.7z', defaultFile=bkf)
+                defaultDir=base_dir,
+                wildcard=barb.BackupSettings.backup_wildcard(),
+                defaultFile=bkf)
         if settings_file:
             with gui.BusyCursor():
                 bkp_setts = barb.BackupSettings(
@@ -1640,8 +1640,32 @@ def _rename_detail_item(self):
         ren_data = super()._rename_detail_item()
         if ren_data: ##: bash.mods.renames needs a spec
             settings['bash.mods.renames'].update(ren_data.renames)
+            self._remap_saves(ren_data.renames)
         return ren_data
 
+    def _remap_saves(self, plugin_renames):
+        """Offer to point the saves that use the renamed plugin(s) to the new
+        name(s)."""
+        if not bush.game.Ess.canReadBasic or not plugin_renames: return
+        remap_saves = [s for s, sinf in bosh.saveInfos.items() if
+                       not plugin_renames.keys().isdisjoint(sinf.masterNames)]
+        if not remap_saves: return
+        msg = _('%(num_saves)d save files use %(old_plugin_names)s. Do you '
+                'want to update them to use the new name(s)? The saves will '
+                'be backed up first.') % {'num_saves': len(remap_saves),
+            'old_plugin_names': ', '.join(map(str, plugin_renames))}
+        if not askYes(self, msg, title=_('Update Saves')): return
+        with balt.Progress(_('Updating Saves…')) as progress:
+            remapped, errors = bosh.saveInfos.remap_masters(plugin_renames,
+                progress, remap_saves)
+        if remapped: # reread the rewritten saves
+            bosh.saveInfos.refresh(RefrIn.from_tabled_infos(
+                {s: bosh.saveInfos[s] for s in remapped}))
+        if errors:
+            showError(self, _('The following save files could not be '
+                              'updated:') + '\n' + '\n'.join(
+                f'{s}: {e}' for s, e in errors.items()))
+
     def _set_date(self, mod_inf):
         mod_inf.setmtime(time.mktime(time.strptime(self.modifiedStr)))
 
@@ -2345,8 +2369,8 @@ def OnDropIndexes(self, indexes, newPos):
             newPos = self.item_count - newPos - 1 - (indexes[-1] - indexes[0])
             if newPos < 0: newPos = 0
         # Move the given indexes to the new position
-        self.data_store.moveArchives(self.GetSelected(), newPos)
-        self.data_store.refresh_n()
+        moved = self.data_store.moveArchives(self.GetSelected(), newPos)
+        self.data_store.refresh_n(touched=moved)
         self.RefreshUI()
 
     def _extractOmods(self, omodnames, progress):
@@ -2506,11 +2530,12 @@ def _handle_key_down(self, wrapped_evt):
             # get the index two positions after the last or before the first
             visibleIndex = self._get_uil_index(sorted_[0]) + moveMod * 2
             maxPos = max(x.order for x in self.data_store.values())
+            moved = []
             for thisFile in sorted_:
                 newPos = self.data_store[thisFile].order + moveMod
                 if newPos < 0 or maxPos < newPos: break
-                self.data_store.moveArchives([thisFile], newPos)
-            self.data_store.refresh_n()
+                moved.extend(self.data_store.moveArchives([thisFile], newPos))
+            self.data_store.refresh_n(touched=moved)
             self.RefreshUI()
             visibleIndex = sorted((visibleIndex, 0, maxPos))[1]
             self.EnsureVisibleIndex(visibleIndex)
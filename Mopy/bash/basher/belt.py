@@ -23,14 +23,18 @@
 """Specific parser for Wrye Bash."""
 from __future__ import annotations
 
+import copy
 import os
 import traceback
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .. import ScriptParser, bass, bolt, bosh, bush, load_order
 from ..ScriptParser import error, PreParser
 from ..balt import ItemLink
 from ..bolt import FName, FNDict, LooseVersion
 from ..env import get_file_version, to_os_path
+from ..exception import StateError
 from ..gui import CENTER, RIGHT, CheckBox, CheckListBox, GridLayout, \
     HBoxedLayout, HLayout, HyperlinkLabel, Label, LayoutOptions, Links, \
     ListBox, PictureWithCursor, StaticBmp, Stretch, TextArea, VLayout, \
@@ -487,6 +491,9 @@ def __init__(self, wiz_parent, installer, bAuto):
         self.page = None
         self.choices = []
         self.choiceIdex = -1
+        # Maps choiceIdex to the interpreter state when that page was shown,
+        # so that Back can go straight to it
+        self._page_snapshots = {}
         self.parser_finished = False
         ##: Figure out why BAIN insists on including an empty sub-package
         # everywhere. Broke this part of the code, hence the 'if s' below.
@@ -510,7 +517,7 @@ def Continue(self):
                         'line_num': self.cLine,
                         'line_contents': newline.strip('\n')},
                      _('Error: %(script_error)s') % {'script_error': e}])
-                return PageError(self._wiz_parent, _('Installer Wizard'), msg)
+                return self._page_error(_('Installer Wizard'), msg)
             except Exception:
                 bolt.deprint('Error while running wizard', traceback=True)
                 msg = '\n'.join([
@@ -521,34 +528,60 @@ def Continue(self):
                     '',
                     traceback.format_exc(),
                 ])
-                return PageError(self._wiz_parent, _('Installer Wizard'), msg)
+                return self._page_error(_('Installer Wizard'), msg)
             if self.page:
                 return self.page
         self.cLine += 1
         self.cLineStart = self.cLine
         self.parser_finished = True
+        return self._page_finish()
+
+    def _page_finish(self):
+        """Create the page shown once the wizard has finished running."""
         return PageFinish(self._wiz_parent, self)
 
+    def _page_error(self, title, msg):
+        """Create the page shown when the wizard was canceled or failed."""
+        return PageError(self._wiz_parent, title, msg)
+
     def Back(self):
         if self.choiceIdex == 0:
             return
-        # Rebegin
-        self._reset_vars()
         self.parser_finished = False
-        i = 0
-        while self.ExecCount > 0 and i < len(self.lines):
-            line = self.lines[i]
-            i += 1
-            if line.startswith('EndExec('):
-                numLines = int(line[8:-1])
-                del self.lines[i-numLines:i]
-                i -= numLines
-                self.ExecCount -= 1
-        self._SelectAll(False)
-        self.cLine = 0
-        self.reversing = self.choiceIdex-1
-        self.choiceIdex = -1
-        return self.Continue()
+        self.page = self._restore_snapshot(self.choiceIdex - 1)
+        return self.page
+
+    def _take_snapshot(self, page_args):
+        """Stores the current interpreter state, along with the arguments
+        needed to recreate the page that is about to be shown."""
+        self._page_snapshots[self.choiceIdex] = (
+            self.variables.copy(), [copy.copy(f) for f in self.Flow],
+            self.notes[:], self.plugin_renames.copy(),
+            {k: v.copy() for k, v in self.iniedits.items()},
+            self.sublist.copy(), self.plugin_enabled.copy(), self.lines[:],
+            self.ExecCount, self.cLine, self.cLineStart, page_args)
+
+    def _restore_snapshot(self, choice_idex):
+        """Puts the interpreter back into the state it was in when the page
+        with the specified index was shown and recreates that page."""
+        (variables, flow, notes, plugin_renames, iniedits, sublist,
+         plugin_enabled, lines, exec_count, c_line, c_line_start,
+         page_args) = self._page_snapshots[choice_idex]
+        # Copy again, since we may come back to this page more than once
+        self.variables = variables.copy()
+        self.Flow = [copy.copy(f) for f in flow]
+        self.notes = notes[:]
+        self.plugin_renames = plugin_renames.copy()
+        self.iniedits = defaultdict(bolt.LowerDict,
+                                    {k: v.copy() for k, v in iniedits.items()})
+        self.sublist = sublist.copy()
+        self.plugin_enabled = plugin_enabled.copy()
+        self.lines = lines[:]
+        self.ExecCount = exec_count
+        self.cLine = c_line
+        self.cLineStart = c_line_start
+        self.choiceIdex = choice_idex
+        return PageSelect(self._wiz_parent, *page_args)
 
     def _resolve_plugin_rename(self, plugin_name: str) -> FName | None:
         return fn if (fn := FName(plugin_name)) in self.plugin_enabled \
@@ -688,7 +721,6 @@ def _KeywordSelect(self, bMany, name_, *args):
         images_ = []
         titles = {}
         descs = []
-        image_paths = []
         while len(args):
             title = args.pop(0)
             is_default = title[0] == '|'
@@ -708,12 +740,13 @@ def _KeywordSelect(self, bMany, name_, *args):
                                'Default', 'EndSelect'], values=defaults_,
                               hitCase=False)
                 return
+        self._add_select_page(bMany, main_desc, titles, descs, images_)
+
+    def _add_select_page(self, bMany, main_desc, titles, descs, images_):
+        """Create the page asking the user to pick from the specified
+        choices, resolving the paths of their images."""
         self.choiceIdex += 1
-        if self.reversing:
-            # We're using the 'Back' button
-            self.reversing -= 1
-            self.PushFlow('Select', False, ['SelectOne', 'SelectMany', 'Case', 'Default', 'EndSelect'], values = self.choices[self.choiceIdex], hitCase=False)
-            return
+        image_paths = []
         imageJoin = self._wizard_dir.join
         for i in images_:
             # Try looking inside the package first, then look if it's using one
@@ -732,8 +765,9 @@ def _KeywordSelect(self, bMany, name_, *args):
                     image_paths.append(None)
             else:
                 image_paths.append(None)
-        self.page = PageSelect(self._wiz_parent, bMany, main_desc, titles,
-                               descs, image_paths)
+        page_args = (bMany, main_desc, titles, descs, image_paths)
+        self._take_snapshot(page_args)
+        self.page = PageSelect(self._wiz_parent, *page_args)
 
     def _SelectSubPackage(self, bSelect, subpackage):
         if subpackage not in self.sublist:
@@ -766,7 +800,6 @@ def _select_all_plugins(self, should_activate):
                                               should_activate)
 
     def kwdRequireVersions(self, game, se='None', ge='None', wbWant='0.0'):
-        if self.bAuto: return
         gameWant = self._TestVersion_Want(game)
         if gameWant == 'None': game = 'None'
         seWant = self._TestVersion_Want(se)
@@ -798,9 +831,15 @@ def kwdRequireVersions(self, game, se='None', ge='None', wbWant='0.0'):
             geHave = 'None'
         bWBOk = LooseVersion(wbHave) >= LooseVersion(wbWant)
         if not bGameOk or not bSEOk or not bGEOk or not bWBOk:
-            self.page = PageVersions(self._wiz_parent, bGameOk, gameHave, game,
-                                     bSEOk, seHave, se, bGEOk, geHave, ge,
-                                     bWBOk, wbHave, wbWant)
+            self.page = self._page_versions(bGameOk, gameHave, game, bSEOk,
+                                            seHave, se, bGEOk, geHave, ge,
+                                            bWBOk, wbHave, wbWant)
+
+    def _page_versions(self, *version_args):
+        """Create the page shown when the versions required by the wizard
+        are not installed. Auto wizards skip it."""
+        if self.bAuto: return None
+        return PageVersions(self._wiz_parent, *version_args)
 
     def _TestVersion_GE(self, want):
         if isinstance(bush.game.Ge.exe, bytes):
@@ -833,7 +872,77 @@ def _TestVersion(need, file_, have=None):
         return [-1, 'None']
 
     def kwdReturn(self):
-        self.page = PageFinish(self._wiz_parent, self)
+        self.page = self._page_finish()
 
     def kwdCancel(self, msg=_('No reason given')):
-        self.page = PageError(self._wiz_parent, _('The installer wizard was canceled:'), msg)
+        self.page = self._page_error(
+            _('The installer wizard was canceled:'), msg)
+
+#------------------------------------------------------------------------------
+class _AutoWryeParser(WryeParser):
+    """A WryeParser that runs a wizard with its default choices, without
+    creating any pages. Continue returns a WizInstallInfo if the wizard ran to
+    completion, or True if it reached a select without defaults, a failed
+    RequireVersions, an error or a Cancel - the regular wizard has to be run
+    for those."""
+
+    def __init__(self, installer):
+        super().__init__(None, installer, bAuto=True)
+
+    def _add_select_page(self, bMany, main_desc, titles, descs, images_):
+        self.page = True
+
+    def _page_finish(self):
+        ret = WizInstallInfo()
+        ret.select_sub_packages = {str(k) for k, v in self.sublist.items()
+                                   if v}
+        ret.select_plugins = {k for k, v in self.plugin_enabled.items() if v}
+        ret.rename_plugins = self.plugin_renames
+        ret.ini_edits = self.iniedits
+        ret.should_install = bass.settings['bash.installers.autoWizard']
+        return ret
+
+    def _page_error(self, title, msg):
+        return True
+
+    def _page_versions(self, *version_args):
+        return True
+
+def _run_auto_wizard(installer) -> WizInstallInfo | None:
+    # We never show any images, so only extract the wizard itself
+    wizard_dir = installer.get_wizard_file_dir(None, extract_images=False)
+    try:
+        parser = _AutoWryeParser(installer)
+        if parser.Begin(wizard_dir.join(installer.hasWizard), wizard_dir):
+            return None # Let the regular wizard report the error
+        ret = parser.Continue()
+        return ret if isinstance(ret, WizInstallInfo) else None
+    finally:
+        if installer.is_archive:
+            cleanup_temp_dir(wizard_dir)
+
+def run_auto_wizards(installers, progress=None) -> dict[
+        FName, WizInstallInfo | None]:
+    """Runs the wizards of all specified installers with their default
+    choices. The wizards are run concurrently and without creating any wizard
+    dialogs, so that many packages can be configured in one go.
+
+    :return: A dict mapping the names of the installers to the results of
+        their wizards. Installers whose wizard needs input from the user or
+        could not be run are mapped to None and have to be run via
+        InstallerWizard instead."""
+    results = {}
+    with (progress := progress or bolt.Progress()), \
+            ThreadPoolExecutor() as ex:
+        progress.setFull(len(installers))
+        futures = {ex.submit(_run_auto_wizard, inst): inst.fn_key
+                   for inst in installers}
+        for i, fut in enumerate(as_completed(futures)):
+            progress(i, _('Running wizards…') + f'\n{futures[fut]}')
+            try:
+                results[futures[fut]] = fut.result()
+            except (OSError, StateError):
+                bolt.deprint(f'Failed to run the wizard of {futures[fut]}',
+                             traceback=True)
+                results[futures[fut]] = None
+    return results
@@ -403,6 +403,9 @@
     'bash.installers.commentsSplitterSashPos': 0,
     'bash.installers.import_order.create_markers': True,
     'bash.installers.import_order.what': 'imp_all',
+    # Maximum size of the extraction cache in MB, 0 disables it
+    'bash.installers.extraction_cache_size': 1024,
+    'bash.installers.link_projects': False,
     #--Wrye Bash: Wizards
     'bash.fomod.size': (600, 500),
     'bash.fomod.pos': DEFAULT_POSITION,
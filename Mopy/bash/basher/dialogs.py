@@ -1066,8 +1066,12 @@ def _handle_ok(self):
                 title=_('Import Order - Invalid CSV'))
             return
         bain_idata = self._bain_parent.data_store
-        reorder_err = bain_idata.reorder_packages(self._partial_package_order)
-        bain_idata.refresh_ns()
+        reorder_err, reordered = bain_idata.reorder_packages(
+            self._partial_package_order)
+        # If we only imported the order, only the reordered packages changed
+        if self._import_what.get_value() != self._key_to_import['imp_order']:
+            reordered = None
+        bain_idata.refresh_ns(touched=reordered)
         self._bain_parent.RefreshUI()
         if reorder_err:
             balt.showError(self, reorder_err, title=_('Import Order - Error'))
@@ -122,9 +122,16 @@ def __init__(self, parent_window, target_installer, show_install_chkbox,
         # Get the game version, be careful about Windows Store games
         gver = bush.game_version()
         version_string = u'.'.join([str(i) for i in gver])
+        # Archives can't change behind our back, so reuse the parsed config if
+        # the same FOMOD has been run before
+        config_key = None
+        if target_installer.is_archive:
+            config_key = (target_installer.crc,
+                          target_installer.member_crcs().get(
+                              target_installer.has_fomod_conf.lower()))
         self.fomod_parser = FomodInstaller(
             fm_file, files_list, self.installer_root, bass.dirs[u'mods'],
-            version_string)
+            version_string, config_key)
         super().__init__(parent_window, sizes_dict=bass.settings,
             title=_('FOMOD Installer - %(fomod_title)s') % {
                 'fomod_title': self.fomod_parser.fomod_name})
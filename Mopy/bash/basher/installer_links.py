@@ -39,7 +39,7 @@
 from itertools import chain
 
 from . import BashFrame, INIList, Installers_Link, InstallersDetails
-from .belt import InstallerWizard, generateTweakLines
+from .belt import InstallerWizard, generateTweakLines, run_auto_wizards
 from .dialogs import SyncFromDataEditor
 from .frames import InstallerProject_OmodConfigDialog
 from .gui_fomod import InstallerFomod
@@ -307,7 +307,14 @@ def _perform_action(self, ui_refresh_, progress):
         # Installer_RunFomod has just one!
         idetails = self.iPanel.detailsPanel
         # Use list() since we're going to deselect packages
-        for sel_package in list(self.iselected_infos()):
+        sel_packages = list(self.iselected_infos())
+        auto_results = {}
+        if self._auto:
+            # Run all wizards that don't need any input from the user in the
+            # background, only the rest will get a wizard dialog
+            with balt.Progress(_('Running wizards…')) as prog:
+                auto_results = run_auto_wizards(sel_packages, prog)
+        for sel_package in sel_packages:
             with BusyCursor():
                 # Select the package we want to install - posts events to
                 # set details and update GUI
@@ -316,13 +323,15 @@ def _perform_action(self, ui_refresh_, progress):
                 # data from BAIN
                 idetails.set_fomod_mode(fomod_enabled=False)
                 idetails.refreshCurrent(sel_package)
-                try:
-                    wizard = InstallerWizard(self.window, sel_package,
-                                             self._auto, balt.Progress)
-                except CancelError:
-                    return
-                wizard.ensureDisplayed()
-            ret = wizard.Run()
+                if not (ret := auto_results.get(sel_package.fn_key)):
+                    try:
+                        wizard = InstallerWizard(self.window, sel_package,
+                                                 self._auto, balt.Progress)
+                    except CancelError:
+                        return
+                    wizard.ensureDisplayed()
+            if not ret:
+                ret = wizard.Run()
             if ret.canceled:
                 if isinstance(ret.canceled, str):
                     self._showWarning(ret.canceled)
@@ -713,8 +722,8 @@ def Execute(self):
             newPos = self.idata[self.idata.lastKey].order + 1
         elif newPos == last_key:
             newPos = len(self.idata)
-        self.idata.moveArchives(self.selected, newPos)
-        self.idata.refresh_n()
+        moved = self.idata.moveArchives(self.selected, newPos)
+        self.idata.refresh_n(touched=moved)
         self.window.RefreshUI(
             detail_item=self.iPanel.detailsPanel.displayed_item)
 
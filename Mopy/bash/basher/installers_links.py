@@ -44,7 +44,7 @@
            u'Installers_AutoWizard', u'Installers_AutoRefreshProjects',
            'Installers_SkipVanillaContent',
            u'Installers_ApplyEmbeddedBCFs', u'Installers_BsaRedirection',
-           u'Installers_RemoveEmptyDirs',
+           u'Installers_RemoveEmptyDirs', 'Installers_LinkProjects',
            u'Installers_ShowInactiveConflicts',
            u'Installers_ShowLowerConflicts',
            u'Installers_ShowActiveBSAConflicts',
@@ -530,6 +530,16 @@ class Installers_RemoveEmptyDirs(BoolLink):
         'data_folder': bush.game.mods_dir}
     _bl_key = 'bash.installers.removeEmptyDirs'
 
+class Installers_LinkProjects(BoolLink):
+    """Toggles option to link instead of copying files from projects."""
+    _text = _('Link Project Files')
+    _help = _('If checked, files installed from projects will be reflinked '
+              'or hard linked into the %(data_folder)s folder instead of '
+              'being copied, where the filesystem supports it. Plugins and '
+              'commonly edited files are never hard linked.') % {
+        'data_folder': bush.game.mods_dir}
+    _bl_key = 'bash.installers.link_projects'
+
 #------------------------------------------------------------------------------
 # Sorting Links ---------------------------------------------------------------
 #------------------------------------------------------------------------------
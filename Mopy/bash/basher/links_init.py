@@ -227,6 +227,7 @@ def InitInstallerLinks():
         inst_settings_menu.links.append_link(SeparatorLink())
         inst_settings_menu.links.append_link(Installers_BsaRedirection())
         inst_settings_menu.links.append_link(Installers_RemoveEmptyDirs())
+        inst_settings_menu.links.append_link(Installers_LinkProjects())
         InstallersList.column_links.append_link(inst_settings_menu)
     if True: #--Conflict Settings
         cflt_settings_menu = MenuLink(_('Conflict Settings..'))
@@ -386,6 +387,7 @@ def InitInstallerLinks():
     settings_menu.append_link(SeparatorLink())
     settings_menu.append_link(Installers_BsaRedirection())
     settings_menu.append_link(Installers_RemoveEmptyDirs())
+    settings_menu.append_link(Installers_LinkProjects())
     settings_menu.append_link(SeparatorLink())
     settings_menu.append_link(Installers_SkipVanillaContent())
     settings_menu.append_link(Installers_GlobalSkips())
@@ -772,6 +774,7 @@ def InitSaveLinks():
         edit_menu.links.append_link(Save_ImportFace())
         edit_menu.links.append_link(Save_UpdateNPCLevels())
         repair_menu = MenuLink(_('Repair..'))
+        repair_menu.links.append_link(Save_ScanBloat())
         repair_menu.links.append_link(Save_Unbloat())
         repair_menu.links.append_link(Save_RepairAbomb())
         repair_menu.links.append_link(Save_RepairHair())
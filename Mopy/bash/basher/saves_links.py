@@ -34,7 +34,8 @@
 from ..balt import AppendableLink, CheckLink, ChoiceLink, EnabledLink, \
     ItemLink, Link, OneItemLink, SeparatorLink
 from ..bass import Store
-from ..bolt import FName, GPath, Path, RefrIn, SubProgress, RefrData
+from ..bolt import FName, GPath, Path, RefrIn, SubProgress, RefrData, \
+    sig_to_str
 from ..bosh import _saves, faces
 from ..brec import ShortFidWriteContext
 from ..exception import ArgumentError, BoltError, ModError
@@ -48,7 +49,8 @@
            u'Save_EditCreatedEnchantmentCosts', u'Save_ImportFace',
            u'Save_EditCreated', u'Save_ReweighPotions', u'Save_UpdateNPCLevels',
            u'Save_ExportScreenshot', u'Save_Unbloat', u'Save_RepairAbomb',
-           u'Save_RepairHair', u'Save_StatPluggy', u'Save_ReorderMasters']
+           u'Save_RepairHair', u'Save_StatPluggy', u'Save_ReorderMasters',
+           'Save_ScanBloat']
 
 #------------------------------------------------------------------------------
 # Saves Links -----------------------------------------------------------------
@@ -861,11 +863,10 @@ class Save_Unbloat(OneItemLink):
 
     def Execute(self):
         #--File Info
-        with balt.Progress(_(u'Scanning for Bloat')) as progress:
-            #--Scan and report
-            saveFile = _saves.SaveFile(self._selected_info)
-            saveFile.load(SubProgress(progress,0,0.8))
-            createdCounts,nullRefCount = saveFile.findBloating(SubProgress(progress,0.8,1.0))
+        with BusyCursor():
+            #--Scan and report - only load the save if there is bloat
+            createdCounts, nullRefCount = _saves.SaveFile(
+                self._selected_info, canSave=False).scan_bloating()
         #--Dialog
         if not createdCounts and not nullRefCount:
             self._showOk(_(u'No bloating found.'), self._selected_item)
@@ -885,7 +886,10 @@ def Execute(self):
             return
         #--Remove bloating
         with balt.Progress(_('Removing Bloat')) as progress:
-            nums = saveFile.removeBloating(createdCounts,True,SubProgress(progress,0,0.9))
+            saveFile = _saves.SaveFile(self._selected_info)
+            saveFile.load(SubProgress(progress, 0, 0.5))
+            nums = saveFile.removeBloating(createdCounts, True,
+                                           SubProgress(progress, 0.5, 0.9))
             progress(0.9,_('Saving…'))
             saveFile.safeSave()
         msg = [_('Uncreated Objects: %(num_uncreated_objs)d'),
@@ -897,6 +901,40 @@ def Execute(self):
             self._selected_item)
         self.refresh_sel()
 
+#------------------------------------------------------------------------------
+class Save_ScanBloat(ItemLink):
+    """Scans the selected saves for bloat and reports the results."""
+    _text = _('Scan for Bloat…')
+    _help = _('Scan the selected saves for bloat and show a summary of the '
+              'results')
+
+    def Execute(self):
+        with balt.Progress(_('Scanning for Bloat')) as progress:
+            results, errors = _saves.scan_saves_bloating(
+                list(self.iselected_infos()), progress)
+        log = bolt.LogFile(io.StringIO())
+        bloated = {k: v for k, v in results.items() if v[0] or v[1]}
+        log.setHeader(_('Summary'))
+        log(_('Scanned saves: %(num_scanned)d') % {
+            'num_scanned': len(results)})
+        log(_('Bloated saves: %(num_bloated)d') % {
+            'num_bloated': len(bloated)})
+        for save_name, (createdCounts, nullRefCount) in sorted(
+                bloated.items()):
+            log.setHeader(save_name)
+            for (created_item_rec_type, rec_full), count_ in sorted(
+                    createdCounts.items()):
+                log(f'* {sig_to_str(created_item_rec_type)} {rec_full}: '
+                    f'{count_}')
+            if nullRefCount:
+                log('* ' + _('Null Reference Objects: %(num_ref_objs)d') % {
+                    'num_ref_objs': nullRefCount})
+        if errors:
+            log.setHeader(_('Saves that could not be scanned'))
+            for save_name, err in sorted(errors.items()):
+                log(f'* {save_name}: {err}')
+        self._showLog(log.out.getvalue(), title=_('Bloat Scan'))
+
 #------------------------------------------------------------------------------
 class Save_UpdateNPCLevels(EnabledLink):
     """Update NPC levels from active mods."""
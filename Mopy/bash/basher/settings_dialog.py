@@ -754,7 +754,8 @@ def _new_backup(self):
         with BusyCursor(): Link.Frame.SaveSettings()
         settings_file = FileSave.display_dialog(self,
             title=_('Backup Wrye Bash Settings'), defaultDir=self._backup_dir,
-            wildcard='*.7z', defaultFile=barb.BackupSettings.backup_filename(
+            wildcard=barb.BackupSettings.backup_wildcard(),
+            defaultFile=barb.BackupSettings.backup_filename(
                 bush.game.bak_game_name))
         if not settings_file: return
         with BusyCursor():
@@ -2804,3 +2804,57 @@ def copy_or_reflink2(a: str | os.PathLike, b: str | os.PathLike):
         https://en.wikipedia.org/wiki/Data_deduplication#reflink for more
         information."""
         shutil.copy2(a, b)
+
+def link_or_reflink(a: str | os.PathLike, b: str | os.PathLike, *,
+                    allow_hardlink=False):
+    """Make b share a's data instead of copying it, overwriting b if it
+    exists. Uses a reflink if possible - those are copy-on-write, so either
+    file may be safely modified afterwards. Otherwise, if allow_hardlink is
+    True, uses a hard link - modifying either file then modifies both, so the
+    caller must make sure neither will be edited in place (see
+    replace_hardlinked). Raises OSError if neither is possible (e.g. a and b
+    are on different filesystems), so that the caller can fall back to a
+    copy."""
+    a, b = os.fspath(a), os.fspath(b) # reflink needs strings
+    os.makedirs(os.path.dirname(b), exist_ok=True)
+    # Link to a temp file next to b, then replace b - os.link won't overwrite
+    temp_b = f'{b}.wbtmp'
+    try:
+        reflinked = False
+        if reflink is not None:
+            try:
+                reflink(a, temp_b)
+                shutil.copystat(a, temp_b)
+                reflinked = True
+            except (OSError, ReflinkImpossibleError, NotImplementedError):
+                if os.path.lexists(temp_b): os.remove(temp_b)
+        if not reflinked:
+            if not allow_hardlink:
+                raise OSError(f'Cannot reflink {a} to {b}')
+            os.link(a, temp_b)
+        os.replace(temp_b, b)
+    except OSError:
+        if os.path.lexists(temp_b): os.remove(temp_b)
+        raise
+
+def replace_hardlinked(a: str | os.PathLike, b: str | os.PathLike) -> bool:
+    """If b is a file that shares its data with other hard links (see
+    link_or_reflink), replace it with a copy of a and return True - copying
+    over b would write into all of them instead. Since the copy is made next
+    to b first, b is only replaced once the copy succeeded. Returns False and
+    leaves b alone otherwise."""
+    a, b = os.fspath(a), os.fspath(b)
+    try:
+        b_stat = os.lstat(b)
+    except OSError:
+        return False # does not exist (yet)
+    if not stat.S_ISREG(b_stat.st_mode) or b_stat.st_nlink < 2:
+        return False
+    temp_b = f'{b}.wbtmp'
+    try:
+        copy_or_reflink2(a, temp_b)
+        os.replace(temp_b, b)
+    except OSError:
+        if os.path.lexists(temp_b): os.remove(temp_b)
+        raise
+    return True
@@ -32,6 +32,7 @@
 import sys
 import time
 from collections import defaultdict, deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from collections.abc import Iterable, Callable
 from dataclasses import dataclass
 from functools import wraps
@@ -3151,6 +3152,43 @@ def rename_profile(self, oldName, newName):
                 pd[newName] = pd[oldName]
             del pd[oldName]
 
+    def remap_masters(self, master_map: dict[FName, FName], progress=None,
+                      save_names: Iterable[FName] | None = None) -> tuple[
+            list[FName], dict[FName, Exception]]:
+        """Rewrite the masters of all saves (or of the specified ones) that
+        use any of the masters in master_map, along with their cosaves. The
+        saves are backed up first and keep their modification times. Saves
+        are rewritten concurrently, since that is mostly (de)compression and
+        I/O.
+
+        :return: A list of the remapped saves and a dict mapping saves that
+            could not be remapped to the error that occurred."""
+        save_names = self if save_names is None else save_names
+        to_remap = [self[s] for s in save_names if
+                    not master_map.keys().isdisjoint(self[s].masterNames)]
+        remapped, errors = [], {}
+        if not to_remap:
+            return remapped, errors
+        def _remap(save_inf):
+            save_inf.makeBackup()
+            prev_mtime = save_inf.ftime
+            save_inf.write_masters(master_map)
+            save_inf.setmtime(prev_mtime)
+        with (progress := progress or bolt.Progress()), \
+                ThreadPoolExecutor() as ex:
+            progress.setFull(len(to_remap))
+            futures = {ex.submit(_remap, s): s.fn_key for s in to_remap}
+            for i, fut in enumerate(as_completed(futures)):
+                progress(i, _('Remapping masters…') + f'\n{futures[fut]}')
+                try:
+                    fut.result()
+                    remapped.append(futures[fut])
+                except (OSError, FileError, SaveHeaderError) as e:
+                    deprint(f'Failed to remap masters of {futures[fut]}',
+                            traceback=True)
+                    errors[futures[fut]] = e
+        return sorted(remapped), errors
+
     @classmethod
     def rightFileType(cls, fileName: bolt.FName | str):
         return all(cls._parse_save_path(fileName))
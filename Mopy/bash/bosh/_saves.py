@@ -32,11 +32,11 @@
 from .save_headers import OblivionSaveHeader
 from .. import bolt, bush
 from ..bolt import Flags, SubProgress, deprint, dict_sort, encode, flag, \
-    pack_byte, pack_int, pack_short, sig_to_str, struct_unpack, \
-    structs_cache, unpack_int, unpack_many, unpack_short, unpack_str8
+    pack_byte, pack_int, pack_short, sig_to_str, struct_error, \
+    struct_unpack, structs_cache, unpack_int, unpack_many, unpack_short, unpack_str8
 from ..brec import FormId, ModReader, MreRecord, RecordType, \
     ShortFidWriteContext, int_unpacker, unpack_header
-from ..exception import ModError, StateError
+from ..exception import ModError, SaveHeaderError, StateError
 from ..mod_files import LoadFactory, ModFile
 from ..wbtemp import TempFile
 
@@ -555,10 +555,7 @@ def findBloating(self,progress=None):
             if full:
                 createdCounts[(citem._rec_sig, full)] += 1
             progress.plus()
-        for k in list(createdCounts):
-            minCount = (50,100)[k[0] == b'ALCH']
-            if createdCounts[k] < minCount:
-                del createdCounts[k]
+        self._prune_created_counts(createdCounts)
         #--Change records
         progress(len(self.created),_(u'Scanning change records.'))
         fids = self.fids
@@ -571,6 +568,59 @@ def findBloating(self,progress=None):
             progress.plus()
         return createdCounts,nullRefCount
 
+    @staticmethod
+    def _prune_created_counts(createdCounts):
+        """Drops created items from createdCounts that do not occur often
+        enough to count as bloat."""
+        for k in list(createdCounts):
+            minCount = (50,100)[k[0] == b'ALCH']
+            if createdCounts[k] < minCount:
+                del createdCounts[k]
+
+    def scan_bloating(self):
+        """Same as findBloating, but works straight off the save file instead
+        of needing a full load() first. Only the created records and the
+        change records of created references are read - everything else is
+        skipped over. Returns (createdCounts,nullRefCount)."""
+        createdCounts = Counter()
+        ref_irefs = []
+        with self.fileInfo.abs_path.open('rb') as ins:
+            self.header = OblivionSaveHeader(self.fileInfo.abs_path, ins=ins)
+            fidsPointer, recordsNum = unpack_many(ins, '2I')
+            ins.seek(8 * 4, 1) # pre-globals
+            ins.seek(unpack_short(ins) * 8, 1) # globals
+            for x in range(4): # pre-created
+                ins.seek(unpack_short(ins), 1)
+            ins.seek(4, 1)
+            createdNum = unpack_int(ins)
+            with ModReader(self.fileInfo.fn_key, ins) as modReader:
+                for count in range(createdNum):
+                    # Plain MreRecords only read their data, FULL is then
+                    # looked up in there without unpacking anything else
+                    citem = MreRecord(unpack_header(modReader), modReader)
+                    if full := citem.getSubString(b'FULL'):
+                        createdCounts[(citem._rec_sig, full)] += 1
+                for x in range(4): # pre-records
+                    ins.seek(unpack_short(ins), 1)
+                for count in range(recordsNum):
+                    rec_id, rec_kind, rec_flgs, _version, siz = unpack_many(
+                        ins, '=IBIBH')
+                    if rec_kind == 49 and rec_id >> 24 == 0xFF and (
+                            rec_flgs & 2):
+                        ref_irefs.append(
+                            struct_unpack('I', ins.read(siz)[4:8])[0])
+                    else:
+                        ins.seek(siz, 1)
+                #--Fids
+                ins.seek(fidsPointer)
+                self.fids = array.array('I')
+                self.fids.fromfile(ins, unpack_int(ins))
+        self._prune_created_counts(createdCounts)
+        fids = self.fids
+        nullRefCount = sum(iref >> 24 != 0xFF and fids[iref] == 0
+                           for iref in ref_irefs)
+        return createdCounts,nullRefCount
+
     def removeBloating(self,uncreateKeys,removeNullRefs=True,progress=None):
         """Removes duplicated created items and null refs."""
         numUncreated = numUnCreChanged = numUnNulled = 0
@@ -644,6 +694,27 @@ def get_npc(self, pc_fid=7):
         npc = SreNPC(recFlags, data)
         return npc, version
 
+def scan_saves_bloating(save_infos, progress=None):
+    """Runs SaveFile.scan_bloating on all specified saves, so that whole save
+    folders can be checked in one go.
+
+    :return: A dict mapping the names of the scanned saves to their
+        (createdCounts,nullRefCount) tuples and a dict mapping saves that
+        could not be scanned to the error that occurred."""
+    results, errors = {}, {}
+    with (progress := progress or bolt.Progress()):
+        progress.setFull(len(save_infos))
+        for i, save_inf in enumerate(save_infos):
+            progress(i, _('Scanning for bloat…') + f'\n{save_inf.fn_key}')
+            try:
+                results[save_inf.fn_key] = SaveFile(
+                    save_inf, canSave=False).scan_bloating()
+            except (OSError, struct_error, ModError, SaveHeaderError) as e:
+                deprint(f'Failed to scan {save_inf.fn_key} for bloat',
+                        traceback=True)
+                errors[save_inf.fn_key] = e
+    return results, errors
+
 #------------------------------------------------------------------------------
 class _SaveData:
     """Encapsulate common SaveFile manipulations."""
@@ -30,6 +30,7 @@
 import re
 import shutil
 import sys
+import threading
 import time
 from collections import defaultdict
 from collections.abc import Iterable
@@ -134,6 +135,233 @@ class _DirFiles(dict):
     def __missing__(self, key):
         return self.setdefault(key, {'dirs': _DirFiles(), 'files': False})
 
+class _DestIndex:
+    """Inverted index mapping destination paths (relative to the Data dir) to
+    the installers that would install a file there and that file's size and
+    crc. Kept in sync with the installers' ci_dest_sizeCrc by InstallersData,
+    so that we don't have to iterate all installers' files to find out who
+    else installs a given path. Install order is not stored in the index, it
+    is read from the installers on lookup, so reordering needs no update.
+    Also keeps track of the destinations that changed since they were last
+    queried and of the installers that have dirty files, so that incremental
+    refreshes don't have to look at every installer."""
+    __slots__ = ('_dest_insts', '_inst_dests', '_changed_dests',
+                 '_dirty_insts')
+
+    def __init__(self):
+        # LowerDict mapping destination paths to dicts of installers to the
+        # (size, crc) of the file they'd install in that path
+        self._dest_insts = bolt.LowerDict()
+        # the ci_dest_sizeCrc dicts we indexed, keyed by installer
+        self._inst_dests = {}
+        # destinations that were added, removed or changed for any installer
+        self._changed_dests = set()
+        # installers that may have dirty files
+        self._dirty_insts = set()
+
+    def index_installer(self, inst):
+        """(Re)index the destinations of the specified installer. Only paths
+        that changed since the last time it was indexed are touched."""
+        new_dests = inst.ci_dest_sizeCrc
+        old_dests = self._inst_dests.get(inst, {})
+        if new_dests is old_dests: # modified in place - drop all to be safe
+            old_dests = {}
+            self.drop_installer(inst)
+        dest_insts = self._dest_insts
+        changed_dests = self._changed_dests
+        for ci_dest in old_dests.keys() - new_dests.keys():
+            self._unlink(ci_dest, inst)
+            changed_dests.add(ci_dest)
+        for ci_dest, sizeCrc in new_dests.items():
+            try:
+                inst_sc = dest_insts[ci_dest]
+            except KeyError:
+                dest_insts[ci_dest] = {inst: sizeCrc}
+                changed_dests.add(ci_dest)
+                continue
+            if inst_sc.get(inst) != sizeCrc:
+                inst_sc[inst] = sizeCrc
+                changed_dests.add(ci_dest)
+        self._inst_dests[inst] = new_dests
+        if inst.dirty_sizeCrc:
+            self._dirty_insts.add(inst)
+
+    def drop_installer(self, inst):
+        """Remove the specified installer from the index."""
+        for ci_dest in self._inst_dests.pop(inst, ()):
+            self._unlink(ci_dest, inst)
+            self._changed_dests.add(ci_dest)
+        self._dirty_insts.discard(inst)
+
+    def _unlink(self, ci_dest, inst):
+        inst_sc = self._dest_insts[ci_dest]
+        del inst_sc[inst]
+        if not inst_sc: del self._dest_insts[ci_dest]
+
+    def rebuild(self, installers: Iterable[Installer]):
+        """Reindex from scratch the specified installers."""
+        self._dest_insts.clear()
+        self._inst_dests.clear()
+        self._dirty_insts.clear()
+        for inst in installers:
+            self.index_installer(inst)
+        self._changed_dests.clear()
+
+    def pop_changed_dests(self) -> set[str]:
+        """Return the destinations that were added, removed or got a
+        different size and crc for any installer since the last call."""
+        changed_dests, self._changed_dests = self._changed_dests, set()
+        return changed_dests
+
+    def dirty_installers(self) -> set[Installer]:
+        """Return the indexed installers that have dirty files."""
+        # dirty files only get added when the destinations are recalculated,
+        # which reindexes the installer - but they may get cleaned at any time
+        self._dirty_insts = {i for i in self._dirty_insts if i.dirty_sizeCrc}
+        return self._dirty_insts
+
+    def dest_installers(self, ci_dest) -> dict[Installer, tuple[int, int]]:
+        """Return a dict mapping all installers that install ci_dest to the
+        (size, crc) of their version of the file. Do not modify it."""
+        return self._dest_insts.get(ci_dest, {})
+
+    def iter_dests(self):
+        """Iterate over all destination paths installed by any installer."""
+        return iter(self._dest_insts)
+
+    def winning_sizeCrc(self, ci_dest):
+        """Return the (size, crc) of the version of ci_dest the highest
+        order active installer would install or None if no active installer
+        has the file."""
+        best_order, best_sc = -1, None
+        for inst, sizeCrc in self.dest_installers(ci_dest).items():
+            if inst.is_active and inst.order > best_order:
+                best_order, best_sc = inst.order, sizeCrc
+        return best_sc
+
+class _ExtractionCache:
+    """Bounded on-disk cache of files extracted from installer archives, so
+    that wizards, FOMODs, BCF conversions and reinstalls of the same archive
+    don't have to spawn 7z to extract the same files again and again. Entries
+    are keyed on the archive crc and the member path and validated against the
+    member crc. Before a file is added, the least recently used entries are
+    evicted until it fits in the limit set by the user - files that can't fit
+    are not cached at all. Cached files are handed out as reflinks where
+    supported and as copies otherwise, so modifying extracted files can never
+    corrupt the cache."""
+
+    def __init__(self, cache_dir: Path):
+        self._cache_dir = cache_dir
+        # Archives may be unpacked from several threads at once
+        self._lock = threading.Lock()
+        self._manifest = bolt.PickleDict(cache_dir.join('Cache.dat'),
+                                         load_pickle=True)
+        # (archive crc, lowercase member path) -> [member crc, size, last use]
+        self._entries = self._manifest.pickled_data.setdefault('entries', {})
+        self._total_size = sum(e[1] for e in self._entries.values())
+
+    def _cache_path(self, arc_crc, member_lower):
+        return os.path.join(self._cache_dir, f'{arc_crc:08X}', member_lower)
+
+    def fetch(self, arc_crc, member_crcs, member_names, dest_dir):
+        """Copy or reflink the cached versions of member_names to dest_dir.
+        Return the member names that could not be served from the cache.
+
+        :param member_crcs: dict mapping the lowercase paths of all members of
+            the archive to their crcs."""
+        with self._lock:
+            missing = []
+            now = time.time()
+            for member in member_names:
+                member_lower = member.lower()
+                key = (arc_crc, member_lower)
+                entry = self._entries.get(key)
+                if (entry is None or
+                        entry[0] != member_crcs.get(member_lower)):
+                    missing.append(member)
+                    continue
+                dest_path = os.path.join(dest_dir, member)
+                try:
+                    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+                    copy_or_reflink2(self._cache_path(*key), dest_path)
+                except OSError: # deleted behind our back - drop the entry
+                    self._drop(key)
+                    missing.append(member)
+                    continue
+                entry[2] = now
+            return missing
+
+    def store(self, arc_crc, member_crcs, member_names, src_dir, max_size):
+        """Add the freshly extracted member_names in src_dir to the cache,
+        evicting least recently used entries to make room for each of them
+        first, so that the cache never grows past max_size bytes. Members
+        that can't fit are skipped."""
+        stored = False
+        for member in member_names:
+            member_lower = member.lower()
+            if (member_crc := member_crcs.get(member_lower)) is None:
+                continue # a wildcard or a directory, we can't key it
+            src_path = os.path.join(src_dir, member)
+            try:
+                if (member_size := os.path.getsize(src_path)) > max_size:
+                    continue
+            except OSError:
+                continue # not extracted
+            key = (arc_crc, member_lower)
+            with self._lock:
+                if key in self._entries: self._drop(key)
+                self._evict(max_size - member_size)
+                if self._total_size + member_size > max_size:
+                    continue # the space is reserved by other threads
+                # Reserve the space, so we can copy without holding the lock
+                self._total_size += member_size
+            cache_path = self._cache_path(*key)
+            tmp_path = f'{cache_path}.{threading.get_ident()}.tmp'
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                copy_or_reflink2(src_path, tmp_path)
+                os.replace(tmp_path, cache_path)
+            except OSError: # we can't write to the cache
+                with self._lock:
+                    self._total_size -= member_size
+                continue
+            with self._lock:
+                if old_entry := self._entries.get(key): # stored concurrently
+                    self._total_size -= old_entry[1]
+                self._entries[key] = [member_crc, member_size, time.time()]
+            stored = True
+        if stored:
+            with self._lock:
+                self._manifest.save()
+
+    def _evict(self, max_size):
+        if self._total_size <= max_size: return
+        for key, _entry in sorted(self._entries.items(),
+                                  key=lambda e: e[1][2]):
+            self._drop(key)
+            if self._total_size <= max_size: break
+
+    def _drop(self, key):
+        self._total_size -= self._entries.pop(key)[1]
+        try:
+            os.remove(self._cache_path(*key))
+        except OSError:
+            pass
+
+_extraction_cache: _ExtractionCache | None = None
+_extraction_cache_lock = threading.Lock()
+
+def _get_extraction_cache():
+    """Return the extraction cache and its maximum size in bytes, or
+    (None, 0) if the user disabled it."""
+    global _extraction_cache
+    if not (max_mb := bass.settings['bash.installers.extraction_cache_size']):
+        return None, 0
+    with _extraction_cache_lock:
+        if _extraction_cache is None:
+            _extraction_cache = _ExtractionCache(bass.dirs['extractionCache'])
+    return _extraction_cache, max_mb * 1024 * 1024
+
 class Installer(ListInfo):
     """Object representing an installer archive, its user configuration, and
     its installation state."""
@@ -813,7 +1041,8 @@ def refreshDataSizeCrc(self, checkOBSE=False, *, splitExt=os.path.splitext,
                 for filename, sizeCrc in self.ci_dest_sizeCrc.items():
                     if filename not in dirty_sizeCrc:
                         dirty_sizeCrc[filename] = sizeCrc
-            self.ci_dest_sizeCrc.clear()
+            self.ci_dest_sizeCrc = bolt.LowerDict()
+            self._index_dests()
             return dest_src
         archiveRoot = self.fn_key.fn_body if self._valid_exts_re else \
             self.fn_key
@@ -1017,9 +1246,17 @@ def refreshDataSizeCrc(self, checkOBSE=False, *, splitExt=os.path.splitext,
             for filename,sizeCrc in old_sizeCrc.items():
                 if filename not in dirty_sizeCrc and sizeCrc != data_sizeCrc.get(filename):
                     dirty_sizeCrc[filename] = sizeCrc
+        self._index_dests()
         #--Done (return dest_src for install operation)
         return dest_src
 
+    def _index_dests(self):
+        """Update the destinations index of InstallersData if we are one of
+        its installers (we may be unpickling or not yet added)."""
+        if (idata := self.instData) is not None and idata.get(
+                self.fn_key) is self:
+            idata.index_dests(self)
+
     def _find_root_index(self, _os_sep=os_sep, skips_start=_silentSkipsStart):
         # basically just care for skips and complex/simple packages
         # Sort file names as (dir_path, filename) pairs
@@ -1224,6 +1461,7 @@ def copy_to(self, dup_path: Path, *, set_time=None):
         for att in atts:
             setattr(clone, att, copy.copy(getattr(self, att)))
         clone.is_active = False # make sure we mark as inactive
+        self._store().index_dests(clone)
         self._store().refresh_n() # no need to change installer status here
 
     def _reset_cache(self, stat_tuple=None, *, __skips_start=tuple(
@@ -1324,6 +1562,12 @@ def _fs_install(self, dest_src, srcDirJoin, progress, subprogressPlus,
         stores = data_tracking_stores()
         store_to_paths = defaultdict(set)
         sources_dests = defaultdict(set)
+        to_link = [] # (src, dest, dest_path, allow_hardlink) tuples
+        # With linked projects, the Data folder may contain files that are
+        # hard linked to the files of another project - (src, dest_path)
+        # tuples for the files we'd otherwise copy over them
+        link_projects = bass.settings['bash.installers.link_projects']
+        maybe_linked = []
         join_data_dir = bass.dirs[u'mods'].join
         for dest, src in dest_src.items():
             dest_size, crc = data_sizeCrc[dest]
@@ -1340,14 +1584,39 @@ def _fs_install(self, dest_src, srcDirJoin, progress, subprogressPlus,
                     break
             else:
                 dest_path = join_data_dir(dest)
+                if (hard := self._link_mode(dest)) is not None:
+                    to_link.append((src, dest, dest_path, hard))
+                    data_sizeCrcDate_update[dest] = [dest_size, crc, -1]
+                    subprogressPlus()
+                    continue
+                if link_projects:
+                    maybe_linked.append((src, dest_path))
+                    data_sizeCrcDate_update[dest] = [dest_size, crc, -1]
+                    subprogressPlus()
+                    continue
             data_sizeCrcDate_update[dest] = [dest_size, crc, -1]
             # Append the ghost extension JIT since the FS operation below will
             # need the exact path to copy to
             sources_dests[srcDirJoin(src)].add(dest_path)
             subprogressPlus()
+        #--Link what we can, copy the rest below
+        for src, dest, dest_path, hard in to_link:
+            try:
+                bolt.link_or_reflink(srcDirJoin(src), dest_path,
+                                     allow_hardlink=hard)
+            except OSError: # e.g. different filesystems
+                maybe_linked.append((src, dest_path))
+            else: # dest shares src's data - and its size, crc and mtime
+                data_sizeCrcDate_update[dest][2] = self.src_sizeCrcDate[src][2]
         #--Now Move
         try:
-            if data_sizeCrcDate_update:
+            # Copying over a hard linked file would write into the other
+            # project's file too, so replace those instead
+            for src, dest_path in maybe_linked:
+                if not bolt.replace_hardlinked(src_path := srcDirJoin(src),
+                                               dest_path):
+                    sources_dests[src_path].add(dest_path)
+            if sources_dests:
                 fs_operation = env.shellMove if unpackDir else env.shellCopy
                 fs_operation(sources_dests, progress.getParent())
         finally:
@@ -1371,6 +1640,12 @@ def _fs_install(self, dest_src, srcDirJoin, progress, subprogressPlus,
         #--Update Installers data
         return data_sizeCrcDate_update, refresh_ui
 
+    def _link_mode(self, dest):
+        """Return None if the file that would be installed to dest (which no
+        data store tracks) must be copied to the Data folder, else whether it
+        may be hard linked there if it can't be reflinked."""
+        return None
+
     def listSource(self):
         """Return package structure as text."""
         log = bolt.LogFile(io.StringIO())
@@ -1423,16 +1698,21 @@ def open_wizard(self): self._open_txt_file(self.hasWizard)
     def open_fomod_conf(self): self._open_txt_file(self.has_fomod_conf)
     def _open_txt_file(self, rel_path): raise NotImplementedError
 
-    def _make_wizard_file_dir(self, wizard_file_name, progress):
+    def _make_wizard_file_dir(self, wizard_file_name, progress,
+                              extract_images=True):
         """Abstract method that should return a directory containing the
         specified wizard file and all files needed to run it.
-        :param progress: only used for archives where we unpack to dir."""
+        :param progress: only used for archives where we unpack to dir.
+        :param extract_images: only used for archives - if False, only the
+            wizard file itself will be unpacked."""
         raise NotImplementedError
 
-    def get_wizard_file_dir(self, progress):
+    def get_wizard_file_dir(self, progress, *, extract_images=True):
         """Return a path to a directory containing all files needed for a
-        BAIN wizard to run."""
-        return self._make_wizard_file_dir(self.hasWizard, progress)
+        BAIN wizard to run. Pass extract_images=False if the wizard is going
+        to be run without a GUI."""
+        return self._make_wizard_file_dir(self.hasWizard, progress,
+                                          extract_images)
 
     def get_fomod_file_dir(self, progress):
         """Return a path to a directory containing all files needed for an
@@ -1571,31 +1851,51 @@ def _parse_archive_line(key, value):
             deprint(archive_msg, traceback=True)
             raise InstallerArchiveError(archive_msg)
 
-    def unpackToTemp(self, fileNames, progress=None, recurse=False):
+    def unpackToTemp(self, fileNames, progress=None, recurse=False, *,
+                     cache_files=False):
         """Extract specified files from archive to a temporary directory.
         progress will be zeroed so pass a SubProgress in. Returns the path of
         the temporary directory the files were extracted to, the caller is
         responsible for cleaning it up.
 
-        :param fileNames: File names (not paths)."""
+        :param fileNames: File names (not paths).
+        :param cache_files: If True, add the extracted files to the
+            extraction cache. Only pass this for small requests that are
+            likely to be repeated (wizards, FOMODs, BCFs) - full installs
+            would just evict everything else."""
         if not fileNames:
             raise ArgumentError(f'No files to extract for {self}.')
         if progress:
             progress.state = 0
             progress.setFull(len(fileNames))
-        with TempFile(temp_prefix='temp_list', temp_suffix='.txt') as tl:
-            with open(tl, 'w', encoding='utf8') as out:
-                out.write('\n'.join(fileNames))
-            unpack_dir = new_temp_dir()
-            try:
-                extract7z(self.abs_path, unpack_dir, progress,
-                    recursive=recurse, filelist_to_extract=tl)
-            finally:
-                ##: Why are we doing this at all? We have a ton of extract7z
-                # calls, but only two do clearReadOnly afterwards
-                bolt.clearReadOnly(unpack_dir)
+        unpack_dir = new_temp_dir()
+        # Serve what we can from the extraction cache, extract the rest
+        cache, max_cache_size = _get_extraction_cache()
+        if cache and self.crc:
+            member_crcs = self.member_crcs()
+            fileNames = cache.fetch(self.crc, member_crcs, fileNames,
+                                    unpack_dir)
+        if fileNames:
+            with TempFile(temp_prefix='temp_list', temp_suffix='.txt') as tl:
+                with open(tl, 'w', encoding='utf8') as out:
+                    out.write('\n'.join(fileNames))
+                try:
+                    extract7z(self.abs_path, unpack_dir, progress,
+                        recursive=recurse, filelist_to_extract=tl)
+                finally:
+                    ##: Why are we doing this at all? We have a ton of
+                    # extract7z calls, but only two do clearReadOnly afterwards
+                    bolt.clearReadOnly(unpack_dir)
+            if cache_files and cache and self.crc:
+                cache.store(self.crc, member_crcs, fileNames, unpack_dir,
+                            max_cache_size)
         return GPath_no_norm(unpack_dir)
 
+    def member_crcs(self):
+        """Return a dict mapping the lowercase paths of the files in this
+        archive to their crcs."""
+        return {full.lower(): crc for full, _size, crc in self.fileSizeCrcs}
+
     def _install(self, dest_src, progress):
         #--Extract
         progress(0, ('%s\n' % self) + _('Extracting files…'))
@@ -1666,7 +1966,11 @@ def _open_txt_file(self, rel_path):
         except OSError:
             pass
 
-    def _make_wizard_file_dir(self, wizard_file_name, progress):
+    def _make_wizard_file_dir(self, wizard_file_name, progress,
+                              extract_images=True):
+        if not extract_images:
+            # Cleaned up by the caller
+            return self.unpackToTemp([wizard_file_name], cache_files=True)
         with progress(_('Extracting images…'), abort=True) as progress:
             # Extract the wizard, and any images as well
             files_to_extract = [wizard_file_name]
@@ -1675,7 +1979,7 @@ def _make_wizard_file_dir(self, wizard_file_name, progress):
             files_to_extract.extend(x for (x, _s, _c) in self.fileSizeCrcs if
                                     x.lower().endswith(image_exts))
             unpack_dir = self.unpackToTemp(files_to_extract, progress,
-                                           recurse=True)
+                                           recurse=True, cache_files=True)
         # Cleaned up by the wizard GUI clients
         return unpack_dir
 
@@ -1799,6 +2103,16 @@ def _fs_refresh(self, progress, stat_tuple, *,
         self.project_refreshed = True
 
     # Installer API -----------------------------------------------------------
+    def _link_mode(self, dest):
+        if not bass.settings['bash.installers.link_projects']:
+            return None
+        # Reflinks are copy-on-write so they are always safe, but hard links
+        # share their data with the project file - only hard link files that
+        # nobody (including us) is going to edit in place
+        return (ext := os.path.splitext(dest)[1].lower()) not in \
+            Installer.commonlyEditedExts and ext not in \
+            bush.game.espm_extensions
+
     def _install(self, dest_src, progress):
         progress.setFull(len(dest_src))
         progress(0, f'{self}\n' + _('Moving files…'))
@@ -1827,7 +2141,8 @@ def walkPath(folder, depth):
 
     def _open_txt_file(self, rel_path): self.abs_path.join(rel_path).start()
 
-    def _make_wizard_file_dir(self, wizard_file_name, progress):
+    def _make_wizard_file_dir(self, wizard_file_name, progress,
+                              extract_images=True):
         return self.abs_path # Wizard file already exists here
 
 #------------------------------------------------------------------------------
@@ -1867,6 +2182,8 @@ def __init__(self):
             bass.dirs[u'corruptBCFs'], bass.dirs[u'installers'])
         #--Volatile
         self.ci_underrides_sizeCrc = bolt.LowerDict() # underridden files
+        # destination path -> installers that install it
+        self._dest_index = _DestIndex()
         self.hasChanged = False
         self.loaded = False
         self.lastKey = FName(u'==Last==')
@@ -1881,6 +2198,34 @@ def bash_dir(self): return bass.dirs[u'bainData']
     @property
     def hide_dir(self): return bass.dirs[u'modsBash'].join(u'Hidden')
 
+    # Keep the destinations index in sync with the installers we store
+    def __setitem__(self, key, inst):
+        if (old := self.get(key)) is not None and old is not inst:
+            self._dest_index.drop_installer(old)
+        super().__setitem__(key, inst)
+        self._dest_index.index_installer(inst)
+
+    def __delitem__(self, key):
+        inst = self[key]
+        super().__delitem__(key)
+        self._drop_dests(inst)
+
+    def pop(self, key, default=None):
+        if (inst := super().pop(key, default)) is not None:
+            self._drop_dests(inst)
+        return inst
+
+    def _drop_dests(self, inst):
+        # renames store the installer under its new key before deleting the
+        # old one - keep it indexed in that case
+        if self.get(inst.fn_key) is not inst:
+            self._dest_index.drop_installer(inst)
+
+    def index_dests(self, inst):
+        """Update the destinations index for an installer whose
+        ci_dest_sizeCrc was recalculated."""
+        self._dest_index.index_installer(inst)
+
     def new_info(self, fileName, progress=None, *, is_proj=True, is_mark=False,
             install_order=None, do_refresh=True, _index=None, fs_load=True):
         """Create, add to self and return a new _InstallerPackage.
@@ -1919,10 +2264,17 @@ def refresh(self, *args, **kwargs):
         return self.irefresh(*args, **kwargs)
 
     def irefresh(self, refresh_info: RefrIn | list | None = None, *,
-        what='DIONSC', progress=None, fullRefresh=False, **kwargs) -> RefrData:
+            what='DIONSC', progress=None, fullRefresh=False,
+            touched: Iterable[Installer] | None = None, **kwargs) -> RefrData:
         """Refresh context parameters are used for updating installers. Note
         that if any of those are not None "changed" will be always True,
-        triggering the rest of the refreshes in irefresh."""
+        triggering the rest of the refreshes in irefresh.
+
+        :param touched: if not None, the installers that were moved or
+            installed since the last refresh and the only ones that changed -
+            the N and S refreshes are then restricted to the destinations of
+            those installers and the installers that share them. Ignored if
+            the D/I/O refreshes detected changes."""
         #--Archive invalidation
         from . import InstallerMarker, modInfos, oblivionIni, bsaInfos
         if (bass.settings['bash.bsaRedirection'] and
@@ -1953,24 +2305,29 @@ def irefresh(self, refresh_info: RefrIn | list | None = None, *,
             order_changed = self.refreshOrder()
             refresh_info.redraw.update(order_changed)
             changes |= bool(order_changed)
+        status_insts = self.values() # refresh the status of all installers
         if 'N' in what or changes:
-            #--dict mapping all should-be-installed files to their attributes
-            norm_sizeCrc = bolt.LowerDict()
-            for package in (x for x in self.sorted_values() if x.is_active):
-                norm_sizeCrc.update(package.ci_dest_sizeCrc)
-            # Populate self.ci_underrides_sizeCrc with all underridden files -
-            # files installed in data dir, but from a lower loading installer
-            # (or manually)
-            ci_underrides_sizeCrc = bolt.LowerDict()
-            for path, sizeCrc in norm_sizeCrc.items():
-                try:
-                    if sizeCrc != (data_sc := self.data_sizeCrcDate[path][:2]):
-                        ci_underrides_sizeCrc[path] = data_sc
-                except KeyError: pass # file is not installed in data dir
-            changes |= self.ci_underrides_sizeCrc != ci_underrides_sizeCrc
-            self.ci_underrides_sizeCrc = ci_underrides_sizeCrc
+            if touched is None or changes:
+                # Populate self.ci_underrides_sizeCrc with all underridden
+                # files - files installed in data dir, but from a lower
+                # loading installer (or manually)
+                self._dest_index.pop_changed_dests() # recalculating all
+                ci_underrides_sizeCrc = self._calc_underrides(
+                    self._dest_index.iter_dests())
+                changes |= self.ci_underrides_sizeCrc != ci_underrides_sizeCrc
+                self.ci_underrides_sizeCrc = ci_underrides_sizeCrc
+            else:
+                touched = {*touched}
+                # Include the destinations the touched installers don't
+                # have anymore, which may no longer be underridden
+                ci_dests = {d for inst in touched
+                            for d in inst.ci_dest_sizeCrc}
+                ci_dests.update(self._dest_index.pop_changed_dests())
+                changes |= self._update_underrides(ci_dests)
+                status_insts = self._overlapping(touched, ci_dests)
         if 'S' in what or changes:
-            st_changed = {k for k, v in self.items() if v.refreshStatus(self)}
+            st_changed = {v.fn_key for v in status_insts if
+                          v.refreshStatus(self)}
             refresh_info.redraw.update(st_changed)
             changes |= bool(st_changed)
         if 'C' in what or changes:
@@ -1999,11 +2356,52 @@ def _list_store_dir(self, refresh_info, fresh_load, fullRefresh, progress):
                 fresh_load=fresh_load) # avoid re-stating freshly unpickled
         return refresh_info
 
-    def refresh_ns(self, progress=None):
-        self.irefresh(what='NS', progress=progress)
+    def _calc_underrides(self, ci_dests: Iterable[CIstr]):
+        """Return a LowerDict mapping those of ci_dests that are underridden
+        to the size and crc of the version in the Data dir."""
+        ci_underrides_sizeCrc = bolt.LowerDict()
+        data_get = self.data_sizeCrcDate.get
+        winning_sizeCrc = self._dest_index.winning_sizeCrc
+        for path in ci_dests:
+            if (data_scd := data_get(path)) is None:
+                continue # file is not installed in data dir
+            if (sizeCrc := winning_sizeCrc(path)) is not None and (
+                    sizeCrc != (data_sc := data_scd[:2])):
+                ci_underrides_sizeCrc[path] = data_sc
+        return ci_underrides_sizeCrc
+
+    def _overlapping(self, touched: set[Installer],
+                     ci_dests: set[str]) -> set[Installer]:
+        """Return the touched installers, all installers that install at
+        least one of ci_dests and all installers with dirty files - the ones
+        whose status may have changed."""
+        dest_installers = self._dest_index.dest_installers
+        overlapping = set(touched)
+        for ci_dest in ci_dests:
+            overlapping.update(dest_installers(ci_dest))
+        overlapping.update(self._dest_index.dirty_installers())
+        return overlapping
+
+    def _update_underrides(self, ci_dests: set[str]):
+        """Recalculate ci_underrides_sizeCrc for the specified destinations
+        only. Return True if it changed."""
+        new_underrides = self._calc_underrides(ci_dests)
+        old_underrides = self.ci_underrides_sizeCrc
+        changed = False
+        for ci_dest in ci_dests:
+            new_sc = new_underrides.get(ci_dest)
+            if old_underrides.get(ci_dest) != new_sc:
+                changed = True
+                if new_sc is None: del old_underrides[ci_dest]
+                else: old_underrides[ci_dest] = new_sc
+        return changed
 
-    def refresh_n(self):
-        self.irefresh(what='N')
+    def refresh_ns(self, progress=None, *,
+                   touched: Iterable[Installer] | None = None):
+        self.irefresh(what='NS', progress=progress, touched=touched)
+
+    def refresh_n(self, *, touched: Iterable[Installer] | None = None):
+        self.irefresh(what='N', touched=touched)
 
     def refresh_i(self, refresh_info: RefrIn | list):
         self.irefresh(refresh_info, what='I')
@@ -2027,6 +2425,8 @@ def __load(self, progress):
                 inst.fn_key = fn_inst
             elif not inst.fn_key: # __setstate blew, probably installer deleted
                 del self[fn_inst]
+        # we bypassed __setitem__ while unpickling, index everything now
+        self._dest_index.rebuild(self.values())
         self.loaded = True
         return True
 
@@ -2087,13 +2487,15 @@ def move_infos(self, sources, destinations, window):
         self.refresh_i(moved)
         return moved
 
-    def reorder_packages(self, partial_order: list[FName]) -> str:
+    def reorder_packages(self, partial_order: list[FName]) -> tuple[
+            str, set[Installer]]:
         """Changes the BAIN package order to match the specified partial order
         as much as possible. Heavily based on lo_reorder. Does not refresh, you
         will have to do that afterwards.
 
         :return: An error message to be shown to the user, or an empty string
-            if nothing noteworthy happened."""
+            if nothing noteworthy happened, and the installers whose order
+            changed (to pass as touched to refresh_ns)."""
         present_packages = set(self)
         partial_packages = set(partial_order)
         # Packages in the partial order that are missing from the Bash
@@ -2126,14 +2528,17 @@ def reorder_packages(self, partial_order: list[FName]) -> str:
                 # Exited the loop without breaking -> some extra plugins should
                 # be appended at the end
                 filtered_order.extend(collected_packages)
+        reordered = set()
         for i, p in enumerate(filtered_order):
-            self[p].order = i
+            if (inst := self[p]).order != i:
+                inst.order = i
+                reordered.add(inst)
         message = ''
         if excess_packages:
             message += _('Some packages could not be found and were '
                          'skipped:') + '\n* '
             message += '\n* '.join(excess_packages)
-        return message
+        return message, reordered
 
     # Getters
     def sorted_pairs(self, package_keys: Iterable[FName] | None = None,
@@ -2177,7 +2582,7 @@ def applyEmbeddedBCFs(self, installers=None, destArchives=None,
             progress(i, installer.fn_key)
             #--Extract the embedded BCF and move it to the Converters folder
             unpack_dir = installer.unpackToTemp([installer.hasBCF],
-                SubProgress(progress, i, i + 0.5))
+                SubProgress(progress, i, i + 0.5), cache_files=True)
             srcBcfFile = unpack_dir.join(installer.hasBCF)
             bcfFile = bass.dirs['converters'].join(f'temp-{srcBcfFile.stail}')
             srcBcfFile.moveTo(bcfFile)
@@ -2540,8 +2945,10 @@ def _path_key():
         return do_refresh #Some tracked files changed, update installers status
 
     #--Operations -------------------------------------------------------------
-    def moveArchives(self,moveList,newPos):
-        """Move specified archives to specified position."""
+    def moveArchives(self, moveList, newPos) -> list[Installer]:
+        """Move specified archives to specified position. Return the moved
+        installers - the relative order of the rest is preserved, so those
+        can be passed as touched to refresh_n/refresh_ns."""
         old_ordered = self.sorted_values(set(self) - set(moveList))
         new_ordered = self.sorted_values(moveList)
         if newPos >= len(self): newPos = len(old_ordered)
@@ -2552,6 +2959,7 @@ def moveArchives(self,moveList,newPos):
         for index, installer in enumerate(old_ordered[newPos:]):
             installer.order = newPos + len(new_ordered) + index
         self.hasChanged = True
+        return new_ordered
 
     #--Install
     def _createTweaks(self, destFiles, installer, tweaksCreated):
@@ -2655,6 +3063,7 @@ def bain_install(self, packages, refresh_ui, progress=None, last=False,
                      override=True):
         """Install selected packages. If override is False install only
         missing files. Otherwise, all (unmasked) files."""
+        touched = None # on errors before we start installing refresh all
         try:
             progress = progress or bolt.Progress()
             tweaksCreated = set()
@@ -2662,7 +3071,7 @@ def bain_install(self, packages, refresh_ui, progress=None, last=False,
             mask = set()
             if last:
                 self.moveArchives(packages, len(self))
-            to_install = {self[x] for x in packages}
+            to_install = touched = {self[x] for x in packages}
             min_order = min(x.order for x in to_install)
             #--Install packages in turn
             progress.setFull(len(packages))
@@ -2689,7 +3098,9 @@ def bain_install(self, packages, refresh_ui, progress=None, last=False,
                     refresh_ui[Store.INIS] = True
             return tweaksCreated
         finally:
-            self.refresh_ns()
+            # only the status of the installed packages and the ones that
+            # share files with them may have changed
+            self.refresh_ns(touched=touched)
 
     #--Uninstall, Anneal, Clean
     @staticmethod
@@ -3058,21 +3469,25 @@ def _sort_bsa_conflicts(bsa_conflict):
                 return active_bsas[bsa_conflict[1]]
             lower_bsa.sort(key=_sort_bsa_conflicts)
             higher_bsa.sort(key=_sort_bsa_conflicts)
-        # Calculate loose conflicts
+        # Calculate loose conflicts - look up who else installs each path
+        inst_conflicts = defaultdict(list)
+        dest_installers = self._dest_index.dest_installers
+        for ci_dest in mismatched:
+            src_sc = src_sizeCrc[ci_dest]
+            for installer, sizeCrc in dest_installers(ci_dest).items():
+                if sizeCrc != src_sc:
+                    inst_conflicts[installer].append(ci_dest)
         lower_loose, higher_loose = [], []
-        for package, installer in self.sorted_pairs():
+        for installer in sorted(inst_conflicts, key=attrgetter('order')):
             if installer.order == srcOrder or not (
                         showInactive or installer.is_active): continue
             if not showLower and installer.order < srcOrder: continue
-            curConflicts = bolt.sortFiles(
-                [x for x, y in installer.ci_dest_sizeCrc.items()
-                if x in mismatched and y != src_sizeCrc[x]])
-            if curConflicts:
-                if installer.order < srcOrder:
-                    conflict_type = lower_loose
-                else:
-                    conflict_type = higher_loose
-                conflict_type.append((installer, package, curConflicts))
+            curConflicts = bolt.sortFiles(inst_conflicts[installer])
+            if installer.order < srcOrder:
+                conflict_type = lower_loose
+            else:
+                conflict_type = higher_loose
+            conflict_type.append((installer, installer.fn_key, curConflicts))
         return lower_loose, higher_loose, lower_bsa, higher_bsa
 
     def find_src_assets(self, src_installer, active_bsas):
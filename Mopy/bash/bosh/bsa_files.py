@@ -35,7 +35,7 @@
 import typing
 import zlib
 from collections import defaultdict
-from functools import partial
+from functools import lru_cache, partial
 from itertools import chain, groupby
 from operator import itemgetter
 from struct import unpack_from as _unpack_from
@@ -741,6 +741,32 @@ def _read_bsa_file(self, folder_records, read_file_records) -> list[bytes]:
             # close the file
         return file_names
 
+@lru_cache(maxsize=256)
+def _ba2_dds_header(dxgi_fmt_index, height, width, num_mips, is_cube_map):
+    """Returns a functional DDS header (including the DXT10 header, if
+    needed) for a texture stored in a DX10 BA2. Textures in an archive share a
+    handful of formats and sizes, so the headers are cached instead of
+    building a DDSFile for every single texture."""
+    dds_file = DDSFile('')
+    dds_file.dds_header.dw_height = height
+    dds_file.dds_header.dw_width = width
+    dds_file.dds_header.dw_mip_map_count = num_mips
+    dds_file.dds_header.dw_depth = 1
+    # 3 == DDS_DIMENSION_TEXTURE2D - PY3: enum!
+    dds_file.dds_dxt10.resource_dimension = 3
+    dds_file.dds_dxt10.array_size = 1
+    if is_cube_map:
+        dds_file.dds_header.dw_caps.DDSCAPS_COMPLEX = True
+        # All but DDSCAPS2_VOLUME or'd together
+        # Archive.exe sticks these into dwCaps, which is 100% wrong, but
+        # that's DDS for you...
+        dds_file.dds_header.dw_caps2 = 0xFE00
+        # 0x4 == DDS_RESOURCE_MISC_TEXTURECUBE
+        dds_file.dds_dxt10.misc_flag = 0x4
+    # This needs to be last, it uses the header's width and height
+    mk_dxgi_fmt(dxgi_fmt_index).setup_file(dds_file, use_legacy_formats=True)
+    return dds_file.dump_file()
+
 class BA2(ABsa):
     bsa_header: Ba2Header
     _folder_type = Ba2Folder
@@ -773,27 +799,6 @@ def _read_rec_or_chunk(record):
                 else:
                     # This is an uncompressed record, just read it
                     return bsa_file.read(record.unpacked_size)
-            def _build_dds_header(dds_file, record):
-                """Helper method, sets up a functional DDS header for the
-                specified DDS file based on the specified record."""
-                dds_file.dds_header.dw_height = record.height
-                dds_file.dds_header.dw_width = record.width
-                dds_file.dds_header.dw_mip_map_count = record.num_mips
-                dds_file.dds_header.dw_depth = 1
-                # 3 == DDS_DIMENSION_TEXTURE2D - PY3: enum!
-                dds_file.dds_dxt10.resource_dimension = 3
-                dds_file.dds_dxt10.array_size = 1
-                if record.cube_maps == 2049:
-                    dds_file.dds_header.dw_caps.DDSCAPS_COMPLEX = True
-                    # All but DDSCAPS2_VOLUME or'd together
-                    # Archive.exe sticks these into dwCaps, which is 100%
-                    # wrong, but that's DDS for you...
-                    dds_file.dds_header.dw_caps2 = 0xFE00
-                    # 0x4 == DDS_RESOURCE_MISC_TEXTURECUBE
-                    dds_file.dds_dxt10.misc_flag = 0x4
-                # This needs to be last, it uses the header's width and height
-                record.dxgi_format.setup_file(
-                    dds_file, use_legacy_formats=True)
             for i, (folder, file_records) in enumerate(
                     folder_to_assets.items()):
                 if progress:
@@ -805,23 +810,22 @@ def _build_dds_header(dds_file, record):
                 os.makedirs(target_dir, exist_ok=True)
                 for filename, f_record in file_records:
                     if is_dx10:
-                        # We're dealing with a DX10 BA2, need to combine all
+                        # We're dealing with a DX10 BA2, need to read all
                         # the texture chunks in the record first
-                        dds_data = b''
-                        for tex_chunk in f_record.tex_chunks:
-                            dds_data += _read_rec_or_chunk(tex_chunk)
-                        # Add a DDS header based on the data in the record,
-                        # then dump the resulting DDS file - cf. BSArch
-                        new_dds_file = DDSFile('')
-                        _build_dds_header(new_dds_file, f_record)
-                        new_dds_file.dds_contents = dds_data
-                        raw_data = new_dds_file.dump_file()
+                        raw_data = [_read_rec_or_chunk(tex_chunk)
+                                    for tex_chunk in f_record.tex_chunks]
+                        # Prepend a DDS header based on the data in the record
+                        # - cf. BSArch
+                        raw_data.insert(0, _ba2_dds_header(
+                            f_record.dxgi_format.fmt_index, f_record.height,
+                            f_record.width, f_record.num_mips,
+                            f_record.cube_maps == 2049))
                     else:
                         # Otherwise, we're dealing with a GNRL BA2, just
                         # read/decompress/write the record directly
-                        raw_data = _read_rec_or_chunk(f_record)
+                        raw_data = [_read_rec_or_chunk(f_record)]
                     with open(os.path.join(target_dir, filename), 'wb') as out:
-                        out.write(raw_data)
+                        out.writelines(raw_data)
 
     def _load_bsa(self):
         with open(self.abs_path, u'rb') as bsa_file:
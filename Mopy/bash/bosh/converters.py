@@ -28,7 +28,9 @@
 import os
 import pickle
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from itertools import chain
+from operator import attrgetter
 
 from .. import archives, bolt
 from ..archives import defaultExt, readExts
@@ -71,15 +73,20 @@ def load(self):
         if references_miss := refs - convs:
             bolt.deprint(f'missing BCFs for {len(references_miss)}')
             self.__prune_srcCRC(lambda c: c not in convs)
-        #Partly reconstruct bcfPath_sizeCrcDate to avoid a full refresh on boot
-        self.bcfPath_sizeCrcDate = {co.fullPath: (None, c, None) for c, co in
-                                    self.bcfCRC_converter.items()}
+        # Reconstruct bcfPath_sizeCrcDate to avoid a full refresh on boot - if
+        # we saved the size and mtime of a BCF we won't even have to CRC it
+        crc_size_date = convertData.get('bcfCRC_sizeDate', {})
+        self.bcfPath_sizeCrcDate = {
+            co.fullPath: (s, c, m) for c, co in self.bcfCRC_converter.items()
+            for s, m in [crc_size_date.get(c, (None, None))]}
         return True
 
     def save(self):
         pickle_dict = self.converterFile.pickled_data
         pickle_dict['bcfCRC_converter'] = self.bcfCRC_converter
         pickle_dict['srcCRC_converters'] = dict(self.srcCRC_converters)
+        pickle_dict['bcfCRC_sizeDate'] = {c: (s, m) for s, c, m in
+                                          self.bcfPath_sizeCrcDate.values()}
         self.converterFile.save()
 
     #--Converters
@@ -89,56 +96,76 @@ def validConverterName(fn_conv):
         return fn_conv.fn_ext == defaultExt and ends_bcf or '-bcf-' in lo
 
     def refreshConverters(self, progress=None, full_refresh=False):
-        """Refresh converter status, and move duplicate BCFs out of the way."""
+        """Refresh converter status, and move duplicate BCFs out of the way.
+        Only BCFs whose size or mtime changed are CRC'd and only BCFs whose
+        CRC we don't know already are loaded - both concurrently."""
         #--Current converters
-        bcfs_list = [bcf_arch for bcf_arch in top_level_files(converters_dir)
-                     if self.validConverterName(bcf_arch)] # few files
+        present_bcfs = [converters_dir.join(bcf_arch) for bcf_arch in
+                        top_level_files(converters_dir)
+                        if self.validConverterName(bcf_arch)] # few files
         bcf_scd = self.bcfPath_sizeCrcDate
         if change := full_refresh: # clear all data structures
             bcf_scd.clear()
             self.srcCRC_converters.clear()
             self.bcfCRC_converter.clear()
-            pending_ = {*map(converters_dir.join, bcfs_list)}
+            pending_ = {*present_bcfs}
         else:
             pending_ = set()
             newData = {}
-            present_bcfs = [*map(converters_dir.join, bcfs_list)]
-            for bcf_archive, bcfPath in [*zip(bcfs_list, present_bcfs)]:
+            stale = {}
+            for bcfPath in present_bcfs:
                 # on first run it needs to repopulate the bcfPath_sizeCrcDate
                 cached_size, crc, mod_time = bcf_scd.get(
                     bcfPath, (None, None, None))
                 size_mtime = bcfPath.size_mtime()
                 if crc is None or (cached_size, mod_time) != size_mtime:
-                    crc_changed = crc != (crc := bcfPath.crc)
-                    bcf_scd[bcfPath] = (size_mtime[0], crc, size_mtime[1])
-                    if crc_changed:
-                        change = True  # added or changed - we must re-add it
-                        pending_.add(bcfPath)
-                        continue
-                newData[crc] = self.bcfCRC_converter[crc] # should be unique
-                newData[crc].fullPath = bcfPath ##: why???
+                    stale[bcfPath] = size_mtime
+            with ThreadPoolExecutor() as ex:
+                stale_crcs = dict(zip(stale, ex.map(attrgetter('crc'), stale)))
+            for bcfPath in present_bcfs:
+                crc = bcf_scd.get(bcfPath, (None, None, None))[1]
+                if bcfPath in stale:
+                    crc_changed = crc != (crc := stale_crcs[bcfPath])
+                    bcf_scd[bcfPath] = (stale[bcfPath][0], crc,
+                                        stale[bcfPath][1])
+                    change |= crc_changed
+                # new BCFs and duplicates of ones we've seen need (re)adding
+                conv = self.bcfCRC_converter.get(crc)
+                if conv is None or crc in newData:
+                    change = True
+                    pending_.add(bcfPath)
+                    continue
+                newData[crc] = conv # renamed BCFs need not be reloaded
+                conv.fullPath = bcfPath
             # Remove any converters that no longer exist
+            present_set = {*present_bcfs}
             for bcfPath in list(bcf_scd):
-                if bcfPath not in present_bcfs:
+                if bcfPath not in present_set:
                     change = True
-                    self.removeConverter(bcfPath)
+                    if bcf_scd[bcfPath][1] in newData: # renamed, keep it
+                        del bcf_scd[bcfPath]
+                    else:
+                        self.removeConverter(bcfPath)
             old_new = set(newData.values())
             self.__prune_srcCRC(
-                lambda c: c.fullPath not in present_bcfs or c not in old_new)
+                lambda c: c.fullPath not in present_set or c not in old_new)
             #--New/update crcs?
             self.bcfCRC_converter = newData  # empty on first run
         if pending_:
             progress = progress or bolt.Progress()
-            with progress:
+            with progress, ThreadPoolExecutor() as ex:
                 progress(0, _('Scanning Converters…'))
                 progress.setFull(len(pending_))
-                for index, bcfPath in enumerate(sorted(pending_)):
+                # BCF.dat is read via a 7z subprocess, so load them in
+                # parallel and add them in order as they come in
+                loading = [(bcfPath, ex.submit(InstallerConverter.from_path,
+                    bcfPath, cached_crc=not full_refresh and bcf_scd[
+                        bcfPath][1])) for bcfPath in sorted(pending_)]
+                for index, (bcfPath, conv_future) in enumerate(loading):
                     progress(index,
                              _('Scanning Converter…') + f'\n{bcfPath}')
-                    path_crc = not full_refresh and bcf_scd[bcfPath][1]
                     try:
-                        converter = InstallerConverter.from_path(bcfPath,
-                            cached_crc=path_crc)
+                        converter = conv_future.result()
                     except StateError: ##: we might get other errors here?
                         cor_dir = self.corrupt_bcfs_dir
                         try:
@@ -150,7 +177,8 @@ def refreshConverters(self, progress=None, full_refresh=False):
                             bolt.deprint(f'{bcfPath} does not exist',
                                          traceback=True)
                         continue
-                    change |= self.addConverter(converter, update_cache=False)
+                    change |= self.addConverter(converter,
+                                                update_cache=full_refresh)
         return change
 
     def addConverter(self, converter: InstallerConverter, update_cache=True):
@@ -522,29 +550,35 @@ def _unpack(self, srcInstaller, fileNames, temp_dir: str, *, progress=None,
         #--Sanity check
         if not fileNames: raise ArgumentError(
             f'No files to extract for {srcInstaller}.')
-        with TempFile(temp_prefix='temp_list', temp_suffix='.txt') as tl:
-            #--Dump file list
-            try:
-                with open(tl, 'w', encoding='utf-8') as out:
-                    out.write('\n'.join(fileNames))
-            except Exception as e:
-                raise StateError(
-                    f'Error creating file list for 7z:\nError: {e}') from e
-            #--Determine settings for 7z
-            installerCRC = srcInstaller.crc
-            apath = srcInstaller if isinstance(
-                srcInstaller, Path) else srcInstaller.abs_path
-            tmp_sub = GPath_no_norm(temp_dir).join(f'{installerCRC:08X}')
-            if progress:
-                progress(0, f"{apath}\n{_('Extracting files…')}")
-                progress.setFull(1 + len(fileNames))
-            try:
-                subArchives = archives.extract7z(apath, tmp_sub, progress,
-                    read_exts=__read_ext, filelist_to_extract=tl)
-            finally:
-                ##: Why are we doing this at all? We have a ton of extract7z
-                # calls, but only two do clearReadOnly afterwards
-                bolt.clearReadOnly(tmp_sub)  ##: do this once
+        if not isinstance(srcInstaller, Path) and srcInstaller.is_archive:
+            # Go through unpackToTemp to make use of the extraction cache
+            tmp_sub = GPath_no_norm(temp_dir).join(f'{srcInstaller.crc:08X}')
+            srcInstaller.unpackToTemp(fileNames, progress).moveTo(tmp_sub)
+            subArchives = [f for f in fileNames if f.endswith(__read_ext)]
+        else:
+            with TempFile(temp_prefix='temp_list', temp_suffix='.txt') as tl:
+                #--Dump file list
+                try:
+                    with open(tl, 'w', encoding='utf-8') as out:
+                        out.write('\n'.join(fileNames))
+                except Exception as e:
+                    raise StateError(f'Error creating file list for 7z:\n'
+                                     f'Error: {e}') from e
+                #--Determine settings for 7z
+                installerCRC = srcInstaller.crc
+                apath = srcInstaller if isinstance(
+                    srcInstaller, Path) else srcInstaller.abs_path
+                tmp_sub = GPath_no_norm(temp_dir).join(f'{installerCRC:08X}')
+                if progress:
+                    progress(0, f"{apath}\n{_('Extracting files…')}")
+                    progress.setFull(1 + len(fileNames))
+                try:
+                    subArchives = archives.extract7z(apath, tmp_sub, progress,
+                        read_exts=__read_ext, filelist_to_extract=tl)
+                finally:
+                    ##: Why are we doing this at all? We have a ton of
+                    # extract7z calls, but only two do clearReadOnly afterwards
+                    bolt.clearReadOnly(tmp_sub)  ##: do this once
         #--Recursively unpack subArchives
         for sub_archive in subArchives:
             # it will also unpack the embedded BCF if any...
@@ -254,6 +254,13 @@ def write_chunk(self, out):
         if not self.fully_decoded:
             out.write(self.chunk_data)
 
+    def decode_chunk(self) -> _xSEChunk:
+        """Returns the decoded version of this chunk. Only lazily read chunks
+        (see _xSELazyChunk) have to do any actual work here.
+
+        :return: The decoded chunk."""
+        return self
+
     def chunk_length(self):
         """Calculates the length of this chunk, i.e. the length of the data
         that follows after this chunk's header. Fully decoded chunks must
@@ -732,6 +739,40 @@ def dump_to_log(self, log, save_masters):
         log('   ' + _('Data: %(string_data)s') % {
             'string_data': self.string_data})
 
+class _xSELazyChunk(_xSEChunk, _Dumpable):
+    """Wraps a chunk whose type we know how to decode, but which does not have
+    to be decoded for getting the master list or remapping plugins (e.g. the
+    potentially huge ARVR and STVR chunks). The chunk's raw data is only
+    indexed when reading the cosave and decoded the first time it is actually
+    needed. If it never gets decoded, it is written back out verbatim."""
+    __slots__ = ('_chunk_class', '_decoded_chunk')
+
+    def __init__(self, ins, chunk_type: str, chunk_class: type[_xSEChunk]):
+        super().__init__(ins, chunk_type)
+        self._chunk_class = chunk_class
+        self._decoded_chunk = None
+
+    def decode_chunk(self):
+        if self._decoded_chunk is None:
+            ins = io.BytesIO(struct_pack('=2I', self.chunk_version,
+                self.data_len) + self.chunk_data)
+            self._decoded_chunk = self._chunk_class(ins, self.chunk_type)
+        return self._decoded_chunk
+
+    def write_chunk(self, out):
+        if self._decoded_chunk is None:
+            super().write_chunk(out)
+        else:
+            self._decoded_chunk.write_chunk(out)
+
+    def chunk_length(self):
+        if self._decoded_chunk is None:
+            return super().chunk_length()
+        return self._decoded_chunk.chunk_length()
+
+    def dump_to_log(self, log, save_masters_):
+        self.decode_chunk().dump_to_log(log, save_masters_)
+
 # Maps all decoded xSE chunk types implemented by xSE itself to the classes
 # that read/write them
 _xse_chunk_dict = {
@@ -771,6 +812,10 @@ class is found, an instance of the generic _xSEChunk class is returned
                 return ch_class(ins, ch_type)
         # Otherwise, fall back to the global xSE dictionary
         ch_class = _xse_chunk_dict.get(ch_type, _xSEChunk)
+        if ch_class.fully_decoded and not issubclass(ch_class, _Remappable):
+            # Nothing we do with cosaves outside of dumping them needs these,
+            # so only decode them on demand
+            return _xSELazyChunk(ins, ch_type, ch_class)
         return ch_class(ins, ch_type)
     except Exception:
         deprint(f'Error while reading cosave chunk {ch_type} at offset '
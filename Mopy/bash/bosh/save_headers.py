@@ -188,6 +188,66 @@ def _read_lsic_int():
                 break
     return uncompressed
 
+# Size of the windows we stream zlib-compressed saves in
+_STREAM_WINDOW = 0x400000
+
+class _ZlibStreamReader:
+    """Read-only, forward-only file-like object that decompresses a zlib
+    stream of compressed_size bytes from ins one window at a time, so that the
+    whole decompressed save never has to be held in memory."""
+
+    def __init__(self, ins, compressed_size: int):
+        self._ins = ins
+        self._comp_left = compressed_size
+        self._decomp = zlib.decompressobj()
+        self._buf = b''
+        self._buf_pos = 0 # how much of self._buf has been read already
+        self._pos = 0
+
+    def _decompress_window(self):
+        """Decompress the next window into the buffer. Returns False once the
+        zlib stream is exhausted."""
+        if not (chunk := self._decomp.unconsumed_tail):
+            if not self._comp_left:
+                return False
+            chunk = self._ins.read(min(self._comp_left, _STREAM_WINDOW))
+            if not chunk:
+                raise SaveHeaderError('Unexpected end of zlib-compressed '
+                                      'save data.')
+            self._comp_left -= len(chunk)
+        try:
+            self._buf = self._buf[self._buf_pos:] + self._decomp.decompress(
+                chunk, _STREAM_WINDOW)
+            self._buf_pos = 0
+        except zlib.error as e:
+            raise SaveHeaderError(f'ZLIB error while decompressing '
+                                  f'zlib-compressed save: {e!r}')
+        return True
+
+    def read(self, size: int):
+        while len(self._buf) - self._buf_pos < size and \
+                self._decompress_window(): pass
+        data = self._buf[self._buf_pos:self._buf_pos + size]
+        self._buf_pos += len(data)
+        self._pos += len(data)
+        return data
+
+    def seek(self, offset: int, whence: int):
+        if whence != 1 or offset < 0:
+            raise NotImplementedError('Can only seek forward relatively')
+        self.read(offset)
+
+    def tell(self):
+        return self._pos
+
+    def iter_windows(self):
+        """Yield the rest of the decompressed data, one window at a time."""
+        while len(self._buf) > self._buf_pos or self._decompress_window():
+            data = self._buf[self._buf_pos:]
+            self._buf, self._buf_pos = b'', 0
+            self._pos += len(data)
+            yield data
+
 def calc_time_fo4(gameDate: bytes) -> (float, int):
     """Handle time calculation from FO4 and newer games. Takes gameDate and
     returns gameDays and gameTicks."""
@@ -589,6 +649,16 @@ def _do_write_header(self, ins, out):
         # Now we need to decompress the portion again
         decompressed_size = unpack_int(ins)
         compressed_size = unpack_int(ins)
+        if self._compress_type is _SaveCompressionType.ZLIB:
+            return self._stream_recompress(ins, out, compressed_size,
+                                           decompressed_size)
+        # LZ4 block compression can't be streamed, do it all in memory
+        self._memory_recompress(ins, out, compressed_size, decompressed_size)
+
+    def _memory_recompress(self, ins, out, compressed_size: int,
+                           decompressed_size: int):
+        """Rewrite the master table of a compressed save, decompressing and
+        recompressing all of it in memory."""
         ins = self._compress_type.decompress_save(ins, compressed_size,
                                                   decompressed_size)
         # Gather the data that will be compressed
@@ -605,6 +675,40 @@ def _do_write_header(self, ins, out):
         pack_int(out, len(compressed_data)) # compressed_size
         out.write(compressed_data)
 
+    def _stream_recompress(self, ins, out, compressed_size: int,
+                           decompressed_size: int):
+        """Rewrite the master table of a zlib-compressed save, decompressing
+        and recompressing the rest of it one window at a time. The sizes
+        are written after the compressed data, since we only know them
+        then."""
+        sizes_pos = out.tell()
+        out.write(b'\x00' * 8) # decompressed_size and compressed_size
+        stream_ins = _ZlibStreamReader(ins, compressed_size)
+        new_masters = io.BytesIO()
+        pack_byte(new_masters, self._formVersion)
+        stream_ins.seek(1, 1) # skip the form version
+        self._write_masters(stream_ins, new_masters)
+        # SSE uses zlib level 1, see _SaveCompressionType.compress_save
+        compressor = zlib.compressobj(1)
+        new_decomp_size = new_comp_size = 0
+        try:
+            for window in chain([new_masters.getvalue()],
+                                stream_ins.iter_windows()):
+                new_decomp_size += len(window)
+                new_comp_size += out.write(compressor.compress(window))
+            new_comp_size += out.write(compressor.flush())
+        except zlib.error as e:
+            raise SaveHeaderError(f'Failed to compress header: {e!r}')
+        if stream_ins.tell() != decompressed_size:
+            raise SaveHeaderError(f'zlib-decompressed header size incorrect '
+                f'- expected {decompressed_size}, but got '
+                f'{stream_ins.tell()}.')
+        end_pos = out.tell()
+        out.seek(sizes_pos)
+        pack_int(out, new_decomp_size)
+        pack_int(out, new_comp_size)
+        out.seek(end_pos)
+
 class Fallout4SaveHeader(SkyrimSaveHeader): # pretty similar to skyrim
     """Valid Save Game Versions 11, 12, 13, 15 (?)"""
     save_magic = b'FO4_SAVEGAME'
@@ -44,6 +44,7 @@
 
 import functools
 import sys
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 from enum import Enum
 
@@ -117,6 +118,41 @@ def __init__(self, parent_installer, sort_key):
 def _parsed_schema():
     return etree.fromstring(schema_string)
 
+@functools.cache
+def _schema_validator():
+    # Compiling the schema is expensive, so only do it once
+    return etree.XMLSchema(_parsed_schema())
+
+class _ParsedConfig(object):
+    """A parsed ModuleConfig.xml, along with the result of validating it
+    against the schema (None if it has not been validated yet)."""
+    __slots__ = ('fomod_tree', 'validation')
+
+    def __init__(self, fomod_tree):
+        self.fomod_tree = fomod_tree
+        self.validation: tuple[bool, object] | None = None
+
+# Parsed configs of archives, keyed on the crc of the archive and the crc of
+# its ModuleConfig.xml, so that reopening an FOMOD does not have to parse and
+# validate it again - oldest entries are dropped first
+_parsed_configs: dict[tuple[int, int], _ParsedConfig] = {}
+_max_parsed_configs = 32
+
+def _get_parsed_config(mc_path, config_key) -> _ParsedConfig:
+    if (parsed := _parsed_configs.pop(config_key, None)) is None:
+        try:
+            parsed = _ParsedConfig(etree.parse(mc_path))
+        except etree.ParseError as e:
+            # Wrap ParseErrors so that GUI code can catch and handle them
+            raise XMLParsingError(str(e)) from e
+    if config_key is not None:
+        # (Re)insert it at the end, so that the oldest configs get dropped
+        # first
+        _parsed_configs[config_key] = parsed
+        if len(_parsed_configs) > _max_parsed_configs:
+            del _parsed_configs[next(iter(_parsed_configs))]
+    return parsed
+
 class InstallerPage(_AFomodBase):
     """Wrapper around the ElementTree element 'installStep'. Provides the
     page's name via the `page_name` instance attribute and the page's groups
@@ -225,6 +261,39 @@ def __init__(self, parent_installer, option_object):
     def __repr__(self):
         return f'InstallerOption<{self.option_name}>'
 
+class _FileListIndex(object):
+    """Case-insensitive index over the files of a package. Allows resolving
+    the files and folders referenced by a FOMOD via a binary search, instead
+    of checking every file in the package for each of them."""
+    __slots__ = ('_keys', '_files')
+
+    def __init__(self, file_list):
+        # Keep the original index, so that we can return matches in the same
+        # order as they appear in file_list
+        sorted_files = sorted((f.lower(), i, f)
+                              for i, f in enumerate(file_list))
+        self._keys = [k for k, _i, _f in sorted_files]
+        self._files = [(i, f) for _k, i, f in sorted_files]
+
+    def find_files(self, source_lower):
+        """Returns the paths of all files in the package that either are the
+        file source_lower or are inside the folder source_lower, in the same
+        order as they appear in the package's file list."""
+        keys = self._keys
+        found = self._files[bisect_left(keys, source_lower):
+                            bisect_right(keys, source_lower)]
+        # We need to include the path separators when checking, since
+        # otherwise we may end up matching e.g. 'Foo - A/bar.esp' to the
+        # source 'Foo', when the source 'Foo - A' exists. All paths starting
+        # with a prefix sort right before the prefix with its last character
+        # incremented.
+        for sep in ('/', '\\'):
+            found.extend(self._files[
+                bisect_left(keys, source_lower + sep):
+                bisect_left(keys, source_lower + chr(ord(sep) + 1))])
+        found.sort()
+        return [f for _i, f in found]
+
 class _FomodFileInfo(object):
     """Stores information about a single file that is going to be installed."""
     __slots__ = (u'file_source', u'file_destination', u'file_priority')
@@ -245,7 +314,8 @@ def __repr__(self):
                f'{self.file_destination} with priority {self.file_priority}>'
 
     @classmethod
-    def process_files(cls, files_elem, file_list, inst_root, is_usable):
+    def process_files(cls, files_elem, file_index: _FileListIndex, inst_root,
+                      is_usable):
         """Processes the elements in files_elem into two lists of
         _FomodFileInfo instances. The first one contains the regular, processed
         files, the second contains processed files that *must* be installed due
@@ -262,7 +332,7 @@ def process_files(cls, files_elem, file_list, inst_root, is_usable):
 
         :param files_elem: An ElementTree element housing the 'file' and
             'folder' elements we want to install
-        :param file_list: A list of all files in the parent package.
+        :param file_index: An index of all files in the parent package.
         :param inst_root: The root path to retrieve sources relative to.
         :param is_usable: True if the type of the option/plugin that this file
             list belongs to is anything but NotUsable."""
@@ -306,10 +376,6 @@ def process_files(cls, files_elem, file_list, inst_root, is_usable):
                 file_dest = GPath_no_norm(file_dest_s)
             file_prty = int(file_object.get(u'priority', u'0'))
             source_lower = file_src.s.lower()
-            # We need to include the path separators when checking, since
-            # otherwise we may end up matching e.g. 'Foo - A/bar.esp' to the
-            # source 'Foo', when the source 'Foo - A' exists.
-            source_starts = (source_lower + u'/', source_lower + u'\\')
             # Check the fileSystemItem attributes alwaysInstall and
             # installIfUsable, which may make arbitrary files required
             if file_object.get('alwaysInstall', 'false') in ('true', '1'):
@@ -319,11 +385,10 @@ def process_files(cls, files_elem, file_list, inst_root, is_usable):
                 fm_infos_target = fm_infos_req
             else:
                 fm_infos_target = fm_infos_con
-            for fsrc in file_list:
-                fsrc_lower = fsrc.lower()
-                if fsrc_lower == source_lower: # it's a file
+            for fsrc in file_index.find_files(source_lower):
+                if fsrc.lower() == source_lower: # it's a file
                     fm_infos_target.append(cls(file_src, file_dest, file_prty))
-                elif fsrc_lower.startswith(source_starts): # it's a folder
+                else: # it's a folder
                     fdest = (file_dest.s + fsrc[len(file_src):]).strip(r'\/')
                     fm_infos_target.append(cls(GPath(fsrc), GPath(fdest),
                                            file_prty))
@@ -354,9 +419,11 @@ class FomodInstaller(object):
     provide any way to do so, leaving that at your discretion."""
     __slots__ = ('fomod_tree', 'fomod_name', 'file_list', 'dst_dir',
                  'game_version', '_current_page', '_all_pages',
-                 '_previous_pages', '_has_finished', 'installer_root')
+                 '_previous_pages', '_has_finished', 'installer_root',
+                 '_file_index', '_parsed_config')
 
-    def __init__(self, mc_path, file_list, inst_root, dst_dir, game_version):
+    def __init__(self, mc_path, file_list, inst_root, dst_dir, game_version,
+                 config_key=None):
         """Creates a new FomodInstaller with the specified properties.
 
         :param mc_path: string path to 'ModuleConfig.xml'
@@ -365,12 +432,13 @@ def __init__(self, mc_path, file_list, inst_root, dst_dir, game_version):
         :param inst_root: The root path of the installer. All files are
             specified relative to this by the FOMOD config.
         :param dst_dir: the destination directory - <Game>/Data
-        :param game_version: version of the game launch exe"""
-        try:
-            self.fomod_tree = etree.parse(mc_path)
-        except etree.ParseError as e:
-            # Wrap ParseErrors so that GUI code can catch and handle them
-            raise XMLParsingError(str(e)) from e
+        :param game_version: version of the game launch exe
+        :param config_key: if not None, a key uniquely identifying the
+            contents of the ModuleConfig (e.g. the crcs of its archive and of
+            the file itself) - used to reuse the parsed and validated config
+            when the same FOMOD is run again"""
+        self._parsed_config = _get_parsed_config(mc_path, config_key)
+        self.fomod_tree = self._parsed_config.fomod_tree
         self.fomod_name = self.fomod_tree.findtext(u'moduleName', u'').strip()
         self.file_list = file_list
         self.installer_root = inst_root
@@ -380,6 +448,8 @@ def __init__(self, mc_path, file_list, inst_root, dst_dir, game_version):
         self._all_pages: dict[int, InstallerPage] = {}
         self._previous_pages: dict[InstallerPage, list[InstallerOption]] = {}
         self._has_finished = False
+        # Built on first use, see get_fomod_files
+        self._file_index: _FileListIndex | None = None
 
     def check_start_conditions(self):
         """Checks if the FOMOD installer can be started in the first place."""
@@ -452,13 +522,15 @@ def move_to_prev(self):
         return prev_page, prev_selected
 
     def get_fomod_files(self):
+        if self._file_index is None:
+            self._file_index = _FileListIndex(self.file_list)
         collected_files = []
         required_files_elem = self.fomod_tree.find(u'requiredInstallFiles')
         if required_files_elem is not None:
             # No need to worry about the con/req split here - we're in the
             # requiredInstallFiles section, so all files are required
             con_files, req_files = _FomodFileInfo.process_files(
-                required_files_elem, self.file_list, self.installer_root,
+                required_files_elem, self._file_index, self.installer_root,
                 is_usable=True)
             collected_files.extend(con_files)
             collected_files.extend(req_files)
@@ -475,7 +547,7 @@ def get_fomod_files(self):
                     # Here we have to worry about the con/req split
                     op_usable = option.option_type is not OptionType.NOT_USABLE
                     con_files, req_files = _FomodFileInfo.process_files(
-                        option_files, self.file_list, self.installer_root,
+                        option_files, self._file_index, self.installer_root,
                         is_usable=op_usable)
                     collected_files.extend(req_files)
                     # Only include the conditional files if the option was
@@ -493,7 +565,7 @@ def get_fomod_files(self):
             # conditions for this section are the only thing that matters
             cond_files = cond_pattern.find('files')
             con_files, req_files = _FomodFileInfo.process_files(
-                cond_files, self.file_list, self.installer_root,
+                cond_files, self._file_index, self.installer_root,
                 is_usable=True)
             collected_files.extend(req_files)
             collected_files.extend(con_files)
@@ -514,9 +586,12 @@ def try_validate(self):
         log. Note that if the boolean is True, the log may be None."""
         if not _can_validate:
             return True, None # lxml is not installed, we can't do validation
-        validator = etree.XMLSchema(_parsed_schema())
-        was_valid = validator.validate(self.fomod_tree)
-        return was_valid, validator.error_log
+        if self._parsed_config.validation is None:
+            validator = _schema_validator()
+            was_valid = validator.validate(self.fomod_tree)
+            # error_log returns a copy, so the next validation won't affect it
+            self._parsed_config.validation = was_valid, validator.error_log
+        return self._parsed_config.validation
 
     def _fomod_flags(self):
         """Returns a mapping of 'flag name' -> 'flag value'.
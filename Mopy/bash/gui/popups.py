@@ -230,9 +230,26 @@ def _validate_input(self):
         return [GPath(p) for p in self._native_widget.GetPaths()]
 
 class FileSave(_FileDialog):
-    """'Save as' dialog."""
+    """'Save as' dialog. If the wildcard offers several filters, the chosen
+    filter decides the extension of the file."""
     _dialog_style = _wx.FD_SAVE | _wx.FD_OVERWRITE_PROMPT
 
+    def _validate_input(self):
+        save_path = super()._validate_input()
+        # wx keeps the extension of defaultFile when the user picks another
+        # filter - so if the path has the extension of another filter, switch
+        # it to the one of the chosen filter
+        filter_exts = [{GPath(p).cext for p in f.split(';')} for f in
+                       self._native_widget.GetWildcard().split('|')[1::2]]
+        if len(filter_exts) < 2: return save_path
+        chosen_exts = filter_exts[self._native_widget.GetFilterIndex()]
+        if len(chosen_exts) == 1 and save_path.cext not in chosen_exts and \
+                any(save_path.cext in e for e in filter_exts):
+            new_ext = next(iter(chosen_exts))
+            if '*' not in new_ext:
+                save_path = GPath(save_path.sroot + new_ext)
+        return save_path
+
 class DirOpen(_FileDialog):
     """'Open directory' dialog."""
     _native_widget: _wx.DirDialog
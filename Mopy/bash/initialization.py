@@ -240,12 +240,13 @@ def init_dirs(game_info, opts, init_warnings):
                                                   'installers', 'Bash')
     deprint(f'Installers bash data location set to {dirs[u"bainData"]}')
     dirs[u'bsaCache'] = dirs[u'bainData'].join(u'BSA Cache')
+    dirs['extractionCache'] = dirs['bainData'].join('Extraction Cache')
     dirs[u'converters'] = dirs[u'installers'].join(u'Bain Converters')
     dirs[u'dupeBCFs'] = dirs[u'converters'].join(u'--Duplicates')
     dirs[u'corruptBCFs'] = dirs[u'converters'].join(u'--Corrupt')
     # create bash user folders, keep these in order
     dir_keys = (u'modsBash', u'installers', u'converters', u'dupeBCFs',
-                u'corruptBCFs', u'bainData', u'bsaCache')
+                u'corruptBCFs', u'bainData', u'bsaCache', 'extractionCache')
     deprint(u'Checking if WB directories exist and creating them if needed:')
     try:
         for dir_key in dir_keys:
@@ -304,8 +305,8 @@ def _dirs_err_msg(e, dir_keys, bainDataSrc, modsBashSrc, oblivionMods,
             msg += (u' '.join(oblivionModsSrc) + f'\n    {oblivionMods}\n')
         else:
             relativePathError.append(oblivionMods)
-    if {u'bainData', u'bsaCache'} & badKeys:
-        # Both derived from 'bainData' -> getBainDataPath
+    if {u'bainData', u'bsaCache', 'extractionCache'} & badKeys:
+        # All derived from 'bainData' -> getBainDataPath
         # Sometimes however, getBainDataPath falls back to oblivionMods,
         # So check to be sure we haven't already added a message about that
         if bainDataSrc != oblivionModsSrc:
@@ -24,7 +24,7 @@
 through PBash (LoadFactory + ModFile) as well as some related classes."""
 
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Container, Iterable
 from zlib import decompress as zlib_decompress
 from zlib import error as zlib_error
 
@@ -300,15 +300,19 @@ def used_masters(self) -> set[FName]:
         masters_set.discard(self.fileInfo.fn_key)
         return masters_set
 
-    def used_masters_by_top(self) -> dict[bytes, set[FName]]:
+    def used_masters_by_top(self, *, discard_self=True
+                            ) -> dict[bytes, set[FName]]:
         """Get a dict mapping top group signatures to sets that indicate what
-        masters those top groups depend on."""
+        masters those top groups depend on. If discard_self is False, the
+        sets will include this file if the top group references its records
+        (needed if they are to be moved to another file)."""
         sig_mas = {}
         for block_sig, block in self.tops.items():
             masters_set = MasterSet([bush.game.master_file])
             block.updateMasters(masters_set.add)
             # The file itself is always implicitly available, so discard it
-            masters_set.discard(self.fileInfo.fn_key)
+            if discard_self:
+                masters_set.discard(self.fileInfo.fn_key)
             sig_mas[block_sig] = set(masters_set) ##: drop once MasterSet is gone
         return sig_mas
 
@@ -385,6 +389,22 @@ def create_record(self, new_rec_sig: bytes, new_rec_fid: FormId = None, *,
 
 # Typing for ModHeaderReader below
 _ModDataDict = defaultdict[bytes, list[tuple[RecHeader, str]]]
+# Cache for ModHeaderReader.read_fid_sigs - maps plugin names and wanted
+# signatures to the plugin's size and mtime and the result for them. Least
+# recently used entries are dropped once more than _max_cached_fid_sigs
+# FormIDs are cached in total
+_fid_sigs_cache: dict[tuple[FName, frozenset[bytes]],
+                      tuple[tuple[int, float], dict[FormId, bytes]]] = {}
+_cached_fid_sigs_count = 0
+_max_cached_fid_sigs = 1_000_000
+
+def _skip_flags_mask(rec_sig: bytes) -> int:
+    """Return a mask of the header flags that would make a record of the
+    specified type return True from should_skip."""
+    flags_type = RecordType.sig_to_class[rec_sig].HeaderFlags
+    return sum(1 << i for i in range(32) if (
+        rec_flags := flags_type(1 << i)).deleted or rec_flags.ignored or
+               rec_flags.partial_form)
 
 # TODO(inf) Use this for a bunch of stuff in mods_metadata.py (e.g. UDRs)
 class ModHeaderReader(object):
@@ -550,6 +570,94 @@ def read_temp_child_headers(mod_info) -> list[RecHeader]:
                 raise ModError(ins.inName, msg) from e
         return ret_headers
 
+    @staticmethod
+    def read_fid_sigs(mod_info, wanted_sigs: Iterable[bytes]) -> \
+            dict[FormId, bytes]:
+        """Reads only the record headers in the top groups of the specified
+        signatures and returns a dict mapping the FormIDs of all present (i.e.
+        not deleted or ignored) records in them to their signatures. Meant for
+        code that only needs to know what type a FormID is, which would
+        otherwise have to load (and decode) all those records. The result is
+        cached until the plugin changes on disk - do not modify it."""
+        global _cached_fid_sigs_count
+        wanted_sigs = frozenset(wanted_sigs)
+        cache_key = (mod_info.fn_key, wanted_sigs)
+        mod_stat = (mod_info.fsize, mod_info.ftime)
+        if cached := _fid_sigs_cache.pop(cache_key, None):
+            if cached[0] == mod_stat:
+                # Reinsert it at the end, so that it gets dropped last
+                _fid_sigs_cache[cache_key] = cached
+                return cached[1]
+            _cached_fid_sigs_count -= len(cached[1])
+        fid_sigs = {}
+        skip_masks = {sig: _skip_flags_mask(sig) for sig in wanted_sigs}
+        with FormIdReadContext.from_info(mod_info) as ins:
+            ins_at_end = ins.atEnd
+            skip_mask = 0
+            try:
+                while not ins_at_end():
+                    next_header = unpack_header(ins)
+                    header_rec_sig = next_header.recType
+                    if header_rec_sig == b'GRUP':
+                        # Only walk the top groups we're interested in and
+                        # skip all children groups (e.g. CELL/DIAL children)
+                        if not next_header.is_top_group_header or \
+                                next_header.label not in wanted_sigs:
+                            next_header.skip_blob(ins)
+                        else:
+                            skip_mask = skip_masks[next_header.label]
+                        continue
+                    if not next_header.flags1 & skip_mask:
+                        fid_sigs[next_header.fid] = header_rec_sig
+                    next_header.skip_blob(ins)
+            except (OSError, struct_error) as e:
+                msg = f'Error scanning {mod_info}, file read pos: {ins.tell()}'
+                raise ModError(ins.inName, msg) from e
+        _fid_sigs_cache[cache_key] = (mod_stat, fid_sigs)
+        _cached_fid_sigs_count += len(fid_sigs)
+        while _cached_fid_sigs_count > _max_cached_fid_sigs:
+            oldest_key = next(iter(_fid_sigs_cache))
+            _cached_fid_sigs_count -= len(_fid_sigs_cache.pop(oldest_key)[1])
+        return fid_sigs
+
+    @staticmethod
+    def read_cell_records(mod_info, wanted_fids: Container[FormId] | None
+                          = None) -> dict[FormId, MreRecord]:
+        """Reads and decodes only the present CELL records in the CELL and
+        WRLD top groups of the specified plugin, skipping the cell children
+        (i.e. reference) groups and all other records by offset. If
+        wanted_fids is given, only decodes the cells with those FormIDs.
+        Returns a dict mapping the cells' FormIDs to the cell records."""
+        cell_class = RecordType.sig_to_class[b'CELL']
+        skip_mask = _skip_flags_mask(b'CELL')
+        # Cell children and their persistent/temporary/distant refs groups
+        skipped_grups = {6, 8, 9, 10}
+        cell_recs = {}
+        with FormIdReadContext.from_info(mod_info) as ins:
+            ins_at_end = ins.atEnd
+            try:
+                while not ins_at_end():
+                    next_header = unpack_header(ins)
+                    if next_header.recType == b'GRUP':
+                        if next_header.is_top_group_header:
+                            if next_header.label not in (b'CELL', b'WRLD'):
+                                next_header.skip_blob(ins)
+                        elif next_header.groupType in skipped_grups:
+                            next_header.skip_blob(ins)
+                        continue # walk world children and cell blocks
+                    if (next_header.recType != b'CELL' or
+                            next_header.flags1 & skip_mask or (
+                            wanted_fids is not None and
+                            next_header.fid not in wanted_fids)):
+                        next_header.skip_blob(ins)
+                    else:
+                        cell_recs[next_header.fid] = cell_class(next_header,
+                                                                ins)
+            except (OSError, struct_error) as e:
+                msg = f'Error scanning {mod_info}, file read pos: {ins.tell()}'
+                raise ModError(ins.inName, msg) from e
+        return cell_recs
+
     @staticmethod
     def read_all_subrecords(mod_info) -> \
             dict[bytes, list[tuple[RecHeader, list[SubrecordBlob]]]]:
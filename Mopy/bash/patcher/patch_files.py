@@ -24,7 +24,7 @@
 
 import re
 import time
-from collections import Counter, defaultdict, deque
+from collections import Counter, defaultdict
 from itertools import chain, count
 from operator import attrgetter
 from typing import Self
@@ -168,6 +168,8 @@ def __init__(self, modInfo, pfile_minfos):
         # Aliases from one mod name to another. Used by text file patchers.
         self.pfile_aliases = {}
         self.mergeIds = set()
+        # The masters split_patch planned for this file, if it was split
+        self.split_masters = None
         # Information arrays
         self.loadErrorMods = []
         self.worldOrphanMods = []
@@ -191,6 +193,9 @@ def __init__(self, modInfo, pfile_minfos):
         self.set_active_arrays(pfile_minfos)
         # cache of mods loaded - eventually share between initData/scanModFile
         self._loaded_mods = {}
+        # present records of loaded mods by signature and FormID - shared by
+        # the patchers that need random access to the records of masters
+        self._present_records = defaultdict(dict)
         # read signatures we need to load per plugin - updated by the patchers
         self._read_signatures = defaultdict(set)
 
@@ -311,6 +316,7 @@ def get_loaded_mod(self, mod_name):
             if loaded_mod.topsSkipped & load_sigs: # we need to reload
                 # never happens for initData but see mergeModFile
                 del self._loaded_mods[mod_name]
+                self._present_records.pop(mod_name, None)
             else:
                 return loaded_mod
         elif mod_name not in self.all_plugins:
@@ -329,6 +335,21 @@ def get_loaded_mod(self, mod_name):
         self._loaded_mods[mod_name] = mod_file
         return mod_file
 
+    def get_present_records(self, mod_name, top_sig):
+        """Return a dict mapping FormIDs to the present records (see
+        iter_present_records) of the specified type in the specified plugin,
+        which must have been loaded via get_loaded_mod. The dict is built on
+        first use and shared by all patchers - do not modify it."""
+        mod_records = self._present_records[mod_name]
+        try:
+            return mod_records[top_sig]
+        except KeyError:
+            loaded_mod = self._loaded_mods[mod_name]
+            mod_records[top_sig] = sig_records = {}
+            for _sig, block in loaded_mod.iter_tops((top_sig,)):
+                sig_records.update(block.iter_present_records())
+            return sig_records
+
     def scanLoadMods(self,progress):
         """Scans load+merge mods."""
         nullProgress = Progress()
@@ -451,7 +472,8 @@ def buildPatch(self,log,progress):
 
     def set_attributes(self, *, was_split=False, split_part=0):
         """Create the description, set appropriate flags, etc."""
-        self.tes4.masters = load_order.get_ordered(self.used_masters())
+        self.tes4.masters = load_order.get_ordered(
+            self.split_masters if was_split else self.used_masters())
         # Build the description
         num_records = sum(x.get_num_records() for x in self.tops.values())
         self.tes4.description = (_('Updated: %(update_time)s') % {
@@ -479,7 +501,8 @@ def set_attributes(self, *, was_split=False, split_part=0):
     def split_patch(self) -> list[Self] | None:
         """Split this patch to fit within the game's master limit. Must not be
         called on BPs that contain a top group with more masters than the game
-        allows, otherwise a RuntimeError will be raised.
+        allows, otherwise a RuntimeError will be raised. Sets split_masters on
+        each returned part.
 
         :return: A list of the created Bashed Patch files, or None if splitting
             was not possible."""
@@ -496,47 +519,61 @@ def new_bp_part():
                     selected=[latest_sel.fileInfo.fn_key],
                     author_str='BASHED PATCH')
             return self.__class__(new_part, self.p_file_minfos)
-        # Find the top groups with the highest number
-        master_dict = self.used_masters_by_top()
+        # Compute the masters of each top group once, then plan which part
+        # each top group goes to before moving anything. Keep our own name in
+        # there, top groups we move to other parts will need us as a master
+        own_name = self.fileInfo.fn_key
+        master_dict = self.used_masters_by_top(discard_self=False)
         max_masters = bush.game.Esp.master_limit
-        if any(len(m) > max_masters for m in master_dict.values()):
-            # Let's be defensive here, the check is cheap and will prevent an
-            # endless loop down below if someone messes up
+        if any(len(m - {own_name}) > max_masters for m in
+               master_dict.values()):
+            # Let's be defensive here, the check is cheap and callers should
+            # have handled this already
             raise RuntimeError(f'Do not call split_patch on BPs with top '
                                f'groups that have >{max_masters} masters!')
-        largest_groups = deque(sorted(master_dict,
-                    key=lambda k: len(master_dict[k]), reverse=True))
-        source_bp_file = self
-        latest_sel = source_bp_file
-        latest_sel = target_bp_file = new_bp_part()
-        all_bp_parts = [source_bp_file, target_bp_file]
-        while True:
-            while True:
-                if not source_bp_file.tops:
-                    # These being empty means we ended up just moving
-                    # everything from the source to the target, which can't fix
-                    # the problem. Fixing this would need record-level
-                    # splitting, so just abort here
+        # Best fit decreasing bin packing: place each top group, largest
+        # first, in the part whose masters it grows the least, starting a new
+        # part only if it fits nowhere. The first part is this file, which
+        # needs no master for itself
+        parts_masters: list[set[FName]] = []
+        parts_sigs: list[list[bytes]] = []
+        for t_sig in sorted(master_dict, key=lambda k: len(master_dict[k]),
+                            reverse=True):
+            t_masters = master_dict[t_sig]
+            best_part = best_growth = None
+            for i, p_masters in enumerate(parts_masters):
+                new_masters = p_masters | t_masters
+                if i == 0:
+                    new_masters.discard(own_name)
+                if len(new_masters) > max_masters:
+                    continue
+                if best_growth is None or (
+                        len(new_masters) - len(p_masters) < best_growth):
+                    best_part = i
+                    best_growth = len(new_masters) - len(p_masters)
+            if best_part is None:
+                if parts_masters and len(t_masters) > max_masters:
+                    # This one would only fit into this file, and that one is
+                    # full. Fixing this would need record-level splitting, so
+                    # just abort here
                     return None
-                # Move the top group with the largest number of masters into
-                # the target file
-                t_sig = largest_groups.popleft()
-                target_bp_file.tops[t_sig] = source_bp_file.tops.pop(t_sig)
-                all_target_masters = target_bp_file.used_masters()
-                if len(all_target_masters) > max_masters:
-                    # The most recent move was too much, undo it and move on to
-                    # the next file
-                    source_bp_file.tops[t_sig] = target_bp_file.tops.pop(t_sig)
-                    largest_groups.appendleft(t_sig)
-                    break
-            all_source_masters = source_bp_file.used_masters()
-            if len(all_source_masters) <= max_masters:
-                # We're done for good, all BP parts are within the master limit
-                break
-            # Wow, this source is big. We need another part to move more of the
-            # source's top groups into
+                best_part = len(parts_masters)
+                parts_masters.append(set())
+                parts_sigs.append([])
+            parts_masters[best_part] |= t_masters
+            if best_part == 0:
+                parts_masters[0].discard(own_name)
+            parts_sigs[best_part].append(t_sig)
+        # Now move the top groups, one pass per part
+        all_bp_parts = [self]
+        latest_sel = self
+        for p_sigs in parts_sigs[1:]:
             latest_sel = target_bp_file = new_bp_part()
+            for t_sig in p_sigs:
+                target_bp_file.tops[t_sig] = self.tops.pop(t_sig)
             all_bp_parts.append(target_bp_file)
+        for bp_part, p_masters in zip(all_bp_parts, parts_masters):
+            bp_part.split_masters = p_masters
         return all_bp_parts
 
     def find_unneded_parts(self, valid_parts: list[Self]) -> list[FName]:
@@ -28,7 +28,7 @@
 from ..base import APatcher, ListPatcher, MultiTweakItem, ScanPatcher
 from ... import load_order
 from ...bolt import deprint
-from ...brec import RecordType
+from ...brec import RecordType, TopComplexGrup
 from ...exception import BPConfigError
 from ...parsers import FidReplacer
 
@@ -87,6 +87,8 @@ def __init__(self, p_name, p_file, enabled_tweaks: list[MultiTweakItem]):
             for read_sig in tweak.tweak_read_classes:
                 tweak_dict[read_sig].append(tweak)
         self._tweak_dict: dict[bytes, list[MultiTweakItem]] = dict(tweak_dict)
+        # How many records each tweak wanted while scanning, for profiling
+        self._tweak_hits: Counter[MultiTweakItem] = Counter()
 
     @classmethod
     def tweak_instances(cls, bashed_patch):
@@ -103,15 +105,25 @@ def _read_sigs(self):
     def scanModFile(self, modFile, progress, scan_sigs=None):
         """We need to iterate only through the master records for complex
         groups."""
+        tweak_hits = self._tweak_hits
         for top_sig, block in modFile.iter_tops(scan_sigs or self._read_sigs):
             patchBlock = self.patchFile.tops.get(top_sig)
+            # Records that are already in the patch have been updated to this
+            # plugin's version by the PatchFile - no need to ask the tweaks
+            # about them again. Complex groups are keyed differently
+            in_patch = () if patchBlock is None or isinstance(
+                patchBlock, TopComplexGrup) else patchBlock.id_records
+            sig_tweaks = self._tweak_dict[top_sig]
             for rid, rec in block.iter_present_records(top_sig): # this
-                for p_tweak in self._tweak_dict[top_sig]:
+                if rid in in_patch: continue
+                for p_tweak in sig_tweaks:
                     if p_tweak.wants_record(rec):
+                        tweak_hits[p_tweak] += 1
                         try:
                             patchBlock.setRecord(rec)
                         except AttributeError:
                             patchBlock = self.patchFile.tops[top_sig]
+                            in_patch = patchBlock.id_records
                             patchBlock.setRecord(rec)
                         break # Exit as soon as a tweak is interested
 
@@ -150,6 +162,10 @@ def buildPatch(self,log,progress):
         for tweak in self.enabled_tweaks:
             tweak.finish_tweaking(self.patchFile)
             tweak.tweak_log(log, tweak_counter[tweak])
+        deprint(f'{self._patcher_name}: records forwarded/tweaked per tweak: '
+                + ', '.join(f'{t.tweak_key}: {self._tweak_hits[t]}/'
+                            f'{sum(tweak_counter[t].values())}'
+                            for t in self.enabled_tweaks))
 
 # Patchers: 10 ----------------------------------------------------------------
 class AliasPluginNamesPatcher(APatcher):
@@ -228,6 +244,11 @@ def _filter_csv_fids(self, parser_instance, loaded_csvs):
         self.old_new = {k: v for k, v in parser_instance.old_new.items() if
             k.mod_fn in earlier_loading and v.mod_fn in earlier_loading}
         self.isActive = bool(self.old_new)
+        # The refs we forwarded because their base is in old_new - maps world
+        # FormIDs (None for interior cells) to cell FormIDs to (index into
+        # __get_refs, ref FormID) tuples, so that buildPatch does not have to
+        # walk every cell
+        self._swap_refs = defaultdict(lambda: defaultdict(set))
 
     def scanModFile(self, modFile, progress, *, __get_refs=(
             attrgetter('temp_refs'), attrgetter('persistent_refs'))):
@@ -244,13 +265,14 @@ def scanModFile(self, modFile, progress, *, __get_refs=(
                 if patch_cell := cfid in patchCells.id_records:
                     patch_cell = patchCells.setRecord(cblock.master_record,
                                                       do_copy=False)
-                for get_refs in __get_refs:
-                    for __, rec in get_refs(cblock).iter_present_records():
+                for i, get_refs in enumerate(__get_refs):
+                    for rid, rec in get_refs(cblock).iter_present_records():
                         if getattr(rec, 'base', None) in self.old_new:
                             if not patch_cell:
                                 patch_cell = patchCells.setRecord(
                                     cblock.master_record)
                             get_refs(patch_cell).setRecord(rec, do_copy=False)
+                            self._swap_refs[None][cfid].add((i, rid))
         if b'WRLD' in modFile.tops:
             patchWorlds = self.patchFile.tops[b'WRLD']
             for wfid, worldBlock in modFile.tops[b'WRLD'].iter_present_records():
@@ -262,8 +284,8 @@ def scanModFile(self, modFile, progress, *, __get_refs=(
                             patch_wrld.ext_cells.id_records):
                         patch_cell = patch_wrld.ext_cells.setRecord(
                             cblock.master_record, do_copy=False)
-                    for get_refs in __get_refs:
-                        for __, rec in get_refs(cblock).iter_present_records():
+                    for i, get_refs in enumerate(__get_refs):
+                        for rid, rec in get_refs(cblock).iter_present_records():
                             if getattr(rec, 'base', None) in self.old_new:
                                 if not patch_wrld:
                                     patch_wrld = patchWorlds.setRecord(
@@ -273,6 +295,7 @@ def scanModFile(self, modFile, progress, *, __get_refs=(
                                         cblock.master_record)
                                 get_refs(patch_cell).setRecord(rec,
                                                                do_copy=False)
+                                self._swap_refs[wfid][wcfid].add((i, rid))
 
     def buildPatch(self, log, progress, *, __get_refs=(attrgetter('temp_refs'),
                    attrgetter('persistent_refs'))):
@@ -290,29 +313,31 @@ def swapper(oldId):
 ##                    count.increment(record.fid.mod_fn)
 ####                    record.mapFids(swapper,True)
 ##                    keep(record.fid, record)
-        for cfid, cellBlock in self.patchFile.tops[b'CELL'].id_records.items():
-            for get_refs in __get_refs:
-                for rid, record in get_refs(cellBlock).id_records.items():
+        # Any ref in the patch whose base we want to swap went through
+        # scanModFile, so only visit the refs it recorded. Later plugins may
+        # have overridden them since, so check their base again
+        patch_tops = self.patchFile.tops
+        for worldId, cell_refs in self._swap_refs.items():
+            if worldId is None:
+                worldBlock = None
+                cell_blocks = patch_tops[b'CELL'].id_records
+            else:
+                worldBlock = patch_tops[b'WRLD'].id_records[worldId]
+                if worldBlock.should_skip():
+                    deprint(f'Block {worldBlock!r} should have been skipped')
+                    continue
+                cell_blocks = worldBlock.ext_cells.id_records
+            keepWorld = False
+            for cfid, ref_locs in cell_refs.items():
+                cellBlock = cell_blocks[cfid]
+                for i, rid in ref_locs:
+                    record = __get_refs[i](cellBlock).id_records[rid]
                     if getattr(record, 'base', None) in self.old_new:
                         record.base = swapper(record.base)
                         count[cfid.mod_fn] += 1
                         ## record.mapFids(swapper,True)
-                        keep(rid, record)
-        for worldId, worldBlock in self.patchFile.tops[
-            b'WRLD'].id_records.items():
-            if worldBlock.should_skip():
-                deprint(f'Block {worldBlock!r} should have been skipped')
-                continue
-            keepWorld = False
-            for cfid, cellBlock in worldBlock.ext_cells.id_records.items():
-                for get_refs in __get_refs:
-                    for rid, record in get_refs(cellBlock).id_records.items():
-                        if getattr(record, 'base', None) in self.old_new:
-                            record.base = swapper(record.base)
-                            count[cfid.mod_fn] += 1
-                            ## record.mapFids(swapper,True)
-                            keepWorld |= keep(rid, record)
-            if keepWorld:
+                        keepWorld |= keep(rid, record)
+            if keepWorld and worldBlock is not None:
                 keep(worldId, worldBlock)
         log.setHeader(f'= {self._patcher_name}')
         self._log_srcs(log)
@@ -34,6 +34,7 @@
 from ... import bush
 from ...bolt import FName, dict_sort, sig_to_str
 from ...brec import FormId
+from ...mod_files import ModHeaderReader
 
 class _Checker(ScanPatcher):
     """Common checkers code."""
@@ -48,7 +49,8 @@ class ContentsCheckerPatcher(_Checker):
     contType_entryTypes = bush.game.cc_valid_types
     contTypes = set(contType_entryTypes)
     entryTypes = set(chain.from_iterable(contType_entryTypes.values()))
-    _read_sigs = tuple(contTypes | entryTypes)
+    # We only need the types of the entries, which we read off the headers
+    _read_sigs = tuple(contTypes)
 
     def __init__(self, p_name, p_file):
         super(ContentsCheckerPatcher, self).__init__(p_name, p_file)
@@ -63,12 +65,14 @@ def scanModFile(self, modFile, progress, scan_sigs=None):
         """Scan modFile."""
         # First, map fids to record type for all records for the valid record
         # types. We need to know if a given fid belongs to one of the valid
-        # types, otherwise we want to remove it.
+        # types, otherwise we want to remove it. Skip fids whose plugin is not
+        # loaded, as filtering a Filter-tagged plugin would
         id_type = self.fid_to_type
-        for entry_type, block in modFile.iter_tops(self.entryTypes):
-            for rid, _record in block.iter_present_records():
-                if rid not in id_type:
-                    id_type[rid] = entry_type
+        loaded_mods = self.patchFile.merged_or_loaded
+        for rid, entry_type in ModHeaderReader.read_fid_sigs(
+                modFile.fileInfo, self.entryTypes).items():
+            if rid not in id_type and rid.mod_fn in loaded_mods:
+                id_type[rid] = entry_type
         # Second, make sure the Bashed Patch contains all records for all the
         # types we may end up patching
         super().scanModFile(modFile, progress, self.contTypes)
@@ -143,9 +147,20 @@ def buildPatch(self,log,progress):
                                 f'{removedId.object_dex:06X}')
 
 #------------------------------------------------------------------------------
+def _is_checked_race(rid, race):
+    """Return True if the checkers handle the eyes and hairs of the specified
+    race."""
+    return (race.flags.playable or rid == bush.game.master_fid(0x038010)
+            ) and race.eyes
+
 class RaceCheckerPatcher(_Checker): # patcher_order 40 to run after Tweak Races
     _read_sigs = (b'EYES', b'HAIR', b'RACE')
 
+    def _add_to_patch(self, rid, record, top_sig):
+        # We need all eyes and hairs for their names, but only the races we
+        # sort - races forwarded by e.g. Tweak Races are in the patch already
+        return top_sig != b'RACE' or _is_checked_race(rid, record)
+
     def buildPatch(self, log, progress):
         if not self.isActive: return
         if b'RACE' not in self.patchFile.tops: return
@@ -155,9 +170,8 @@ def buildPatch(self, log, progress):
                     self.patchFile.tops[b'EYES'].id_records.items()}
         hairNames = {k: x.full for k, x in
                      self.patchFile.tops[b'HAIR'].id_records.items()}
-        skip_race_fid = bush.game.master_fid(0x038010)
         for rid, race in self.patchFile.tops[b'RACE'].id_records.items():
-            if (race.flags.playable or rid == skip_race_fid) and race.eyes:
+            if _is_checked_race(rid, race):
                 prev_hairs = race.hairs[:]
                 race.hairs.sort(key=lambda x: hairNames.get(x) or '')
                 prev_eyes = race.eyes[:]
@@ -196,6 +210,13 @@ def __init__(self, p_name, p_file):
         super(NpcCheckerPatcher, self).__init__(p_name, p_file)
         self.vanilla_eyes = _find_vanilla_eyes()
 
+    def _add_to_patch(self, rid, record, top_sig):
+        # Only forward the NPCs we may have to fix. NPCs that other patchers
+        # forwarded are in the patch already and will be checked too
+        if top_sig == b'NPC_':
+            return not (record.eye and record.hair and record.hairLength)
+        return top_sig != b'RACE' or _is_checked_race(rid, record)
+
     def buildPatch(self,log,progress):
         """Updates races as needed."""
         if not self.isActive: return
@@ -216,7 +237,7 @@ def buildPatch(self,log,progress):
                        if not x.flags.not_female}
         skip_race_fid = bush.game.master_fid(0x038010)
         for rid, race in patchFile.tops[b'RACE'].id_records.items():
-            if (race.flags.playable or rid == skip_race_fid) and race.eyes:
+            if _is_checked_race(rid, race):
                 final_eyes[rid] = [x for x in self.vanilla_eyes.get(rid, [])
                                    if x in race.eyes]
                 if not final_eyes[rid]:
@@ -229,6 +250,8 @@ def buildPatch(self,log,progress):
         player_fid = bush.game.master_fid(0x000007)
         for npc_fid, npc in patchFile.tops[b'NPC_'].id_records.items():
             if npc_fid == player_fid: continue # skip player
+            if npc.eye and npc.hair and npc.hairLength:
+                continue # nothing to fix
             if (npc.full is not None and npc.race == skip_race_fid and
                     not reProcess.search(npc.full)): continue
             if is_templated(npc, 'use_model_animation'):
@@ -699,7 +699,7 @@ def scanModFile(self, modFile, progress):
         if sc_name in self.de_masters:
             for _sig, block in modFile.iter_tops(self._read_sigs):
                 for rid, de_list in block.iter_present_records():
-                    self.masterItems[rid][sc_name] = set(
+                    self.masterItems[rid][sc_name] = tuple(
                         self._get_entries(de_list))
         #--Relev/Delev setup
         applied_tags = self.tag_choices[sc_name]
@@ -715,9 +715,11 @@ def scanModFile(self, modFile, progress):
                     stored_lists[rid].mergeOverLast = True
                     continue
                 is_list_owner = (rid.mod_fn == sc_name)
-                #--Items, delevs and relevs sets
-                new_list.items = items = set(self._get_entries(new_list))
+                #--Delevs and relevs sets - items are only needed once we
+                # merge into this list, see _own_list
                 if not is_list_owner:
+                    items = set(self._get_entries(new_list)) if (
+                        is_relev or is_delev) else None
                     #--Relevs
                     new_list.re_records = items.copy() if is_relev else set()
                     #--Delevs: all items in masters minus current items
@@ -727,22 +729,38 @@ def scanModFile(self, modFile, progress):
                         if id_master_items:
                             for de_master in modFile.tes4.masters:
                                 if de_master in id_master_items:
-                                    delevs |= id_master_items[de_master]
+                                    delevs.update(id_master_items[de_master])
                             # TODO(inf) Double-check that this works correctly,
                             #  this line (delevs -= items) seems a noop here
                             delevs -= items
-                            new_list.items |= delevs
-                #--Cache/Merge
+                #--Cache/Merge - store the plugin's own record, we only need
+                # to copy it if a later plugin merges into it
                 if is_list_owner:
-                    de_list = copy.deepcopy(new_list)
-                    de_list.mergeSources = []
-                    stored_lists[rid] = de_list
+                    new_list.mergeSources = []
+                    stored_lists[rid] = new_list
                 elif rid not in stored_lists:
-                    de_list = copy.deepcopy(new_list)
-                    de_list.mergeSources = [sc_name]
-                    stored_lists[rid] = de_list
+                    new_list.mergeSources = [sc_name]
+                    stored_lists[rid] = new_list
                 else:
-                    stored_lists[rid].mergeWith(new_list, sc_name)
+                    self._own_list(stored_lists, rid).mergeWith(new_list,
+                                                                sc_name)
+
+    def _own_list(self, stored_lists, rid):
+        """Return the stored list with the specified FormID, ready to be
+        merged into. If it is still the record we read from its plugin (its
+        items have not been computed yet), replace it with a copy first."""
+        stored_list = stored_lists[rid]
+        if stored_list.items is None:
+            stored_list = stored_lists[rid] = copy.deepcopy(stored_list)
+            self._set_items(stored_list)
+        return stored_list
+
+    def _set_items(self, stored_list):
+        """Compute the items of the specified stored list - including the
+        ones it deleveled, so later plugins won't re-add those."""
+        stored_list.items = set(self._get_entries(stored_list))
+        if stored_list.de_records:
+            stored_list.items |= stored_list.de_records
 
     def buildPatch(self, log, progress):
         keep = self.patchFile.getKeeper()
@@ -775,45 +793,47 @@ def buildPatch(self, log, progress):
             stored_lists = self.type_list[list_type_sig]
             empty_lists = []
             # Build a dict mapping leveled lists to other leveled lists that
-            # they are sublists in
-            sub_supers = {x: [] for x in stored_lists} ##: defaultdict??
-            for stored_list in stored_lists.values():
-                list_fid = stored_list.fid
+            # they are sublists in and count the items of each non-empty list
+            sub_supers = defaultdict(list)
+            items_left = {}
+            for list_fid, stored_list in stored_lists.items():
+                if stored_list.items is None: # never merged into
+                    self._set_items(stored_list)
                 if not stored_list.items:
                     empty_lists.append(list_fid)
-                else:
-                    sub_lists = [x for x in stored_list.items if
-                                 x in sub_supers]
-                    for sub_list in sub_lists:
+                    continue
+                items_left[list_fid] = len(stored_list.items)
+                for sub_list in stored_list.items:
+                    if sub_list in stored_lists:
                         sub_supers[sub_list].append(list_fid)
-            #--Clear empties
+            #--Propagate emptiness - a list whose items are all empty lists is
+            # empty too, so we can clean up even more lists. empty_lists grows
+            # while we iterate it and each list ends up in it at most once
+            super_empties = defaultdict(set)
+            for empty_list in empty_lists:
+                for sub_super in sub_supers.get(empty_list, ()):
+                    super_empties[sub_super].add(empty_list)
+                    items_left[sub_super] -= 1
+                    if not items_left[sub_super]:
+                        empty_lists.append(sub_super)
+            #--Clear empties - rewriting each list only once
             removed_empty_sublists = set()
             cleaned_lists = set()
-            while empty_lists:
-                empty_list = empty_lists.pop()
-                if empty_list not in sub_supers: continue
-                # We have an empty list, look if it's a sublist in any other
-                # list
-                for sub_super in sub_supers[empty_list]:
-                    stored_list = stored_lists[sub_super]
-                    # Remove the emtpy list from this sublist
-                    old_entries = stored_list.entries
-                    stored_list.entries = [x for x in stored_list.entries
-                                           if x.listId != empty_list]
-                    stored_list.items.remove(empty_list)
-                    patch_block.setRecord(stored_list, do_copy=False)
-                    # If removing the empty list made this list empty too, then
-                    # we should investigate it as well - could clean up even
-                    # more lists
-                    if not stored_list.items:
-                        empty_lists.append(sub_super)
-                    removed_empty_sublists.add(stored_lists[empty_list].eid)
-                    # We don't need to write out records where another mod has
-                    # already removed the empty sublist - that would just make
-                    # an ITPO
-                    if old_entries != stored_list.entries:
-                        cleaned_lists.add(stored_list.eid)
-                        keep(sub_super, stored_list)
+            for sub_super, sub_empties in super_empties.items():
+                stored_list = stored_lists[sub_super]
+                old_entries = stored_list.entries
+                stored_list.entries = [x for x in old_entries
+                                       if x.listId not in sub_empties]
+                stored_list.items -= sub_empties
+                patch_block.setRecord(stored_list, do_copy=False)
+                removed_empty_sublists.update(stored_lists[e].eid
+                                              for e in sub_empties)
+                # We don't need to write out records where another mod has
+                # already removed the empty sublists - that would just make
+                # an ITPO
+                if old_entries != stored_list.entries:
+                    cleaned_lists.add(stored_list.eid)
+                    keep(sub_super, stored_list)
             log.setHeader('=== ' + _('Empty %(ll_label)s Sublists') % {
                 'll_label': sig_label[list_type_sig]})
             for list_eid in sorted(removed_empty_sublists, key=str.lower):
@@ -35,6 +35,7 @@
 from ...bolt import attrgetter_cache, combine_dicts, deprint, setattr_deep
 from ...brec import RecordType
 from ...exception import ModSigMismatchError
+from ...mod_files import ModHeaderReader
 
 #------------------------------------------------------------------------------
 class APreserver(ImportPatcher):
@@ -180,12 +181,17 @@ def initData(self, progress, __attrgetters=attrgetter_cache):
                 id_data.update(mod_id_data)
                 continue
             for master in srcFile.fileInfo.masterNames:
-                if not (masterFile := self.patchFile.get_loaded_mod(master)):
+                if not self.patchFile.get_loaded_mod(master):
                     continue # or break filter mods
-                for rsig, block in masterFile.iter_tops(mod_sigs):
-                    for rfid, record in block.iter_present_records():
-                        if rfid not in mod_id_data: continue
-                        for attr, val in mod_id_data[rfid].items():
+                # Look up the records we need instead of walking the master's
+                # whole top groups - for each source
+                for rsig in mod_sigs:
+                    master_records = self.patchFile.get_present_records(
+                        master, rsig)
+                    for rfid, attr_vals in mod_id_data.items():
+                        if (record := master_records.get(rfid)) is None:
+                            continue
+                        for attr, val in attr_vals.items():
                             try:
                                 if val == __attrgetters[attr](record):
                                     continue
@@ -412,12 +418,40 @@ def __init__(self, p_name, p_file, p_sources):
         self.cellData = defaultdict(dict)
         self.recAttrs = bush.game.cellRecAttrs # dict[str, tuple[str]]
 
+    def _update_patcher_factories(self, p_file):
+        # We read the cells of our sources' masters straight off the plugins,
+        # see _master_cells
+        p_file.update_read_factories(self._read_sigs, self.srcs)
+
+    def _master_cells(self, master, wanted_fids):
+        """Return a dict mapping the FormIDs of the present cells in the
+        specified master that are in wanted_fids to the cell records. Only
+        decodes those cell records, not the rest of the master's cells and
+        none of the references in them."""
+        p_file = self.patchFile
+        if master not in p_file.load_dict and 'Filter' in p_file.all_tags[
+                master]:
+            # get_loaded_mod will filter this one for us
+            p_file.update_read_factories(self._read_sigs, [master])
+            master_file = p_file.get_loaded_mod(master)
+            return {cfid: cell_rec for _sig, block in
+                    master_file.iter_tops(self._read_sigs) for cfid, cell_rec
+                    in block.iter_present_records(b'CELL') if
+                    cfid in wanted_fids}
+        return ModHeaderReader.read_cell_records(p_file.all_plugins[master],
+                                                 wanted_fids)
+
     def initData(self, progress, __attrgetters=attrgetter_cache):
         """Get cells from source files."""
         if not self.isActive: return
         cellData = self.cellData
         if self.srcs:
             progress.setFull(len(self.srcs))
+        # First collect the cell data of all sources, so that we only have to
+        # read the cells of each master once, no matter how many sources have
+        # it as a master
+        src_cell_data = []
+        master_wanted_fids = defaultdict(set)
         for srcMod in self.srcs:
             # tempCellData maps long fids for cells in srcMod to dicts of
             # (attributes (among attrs) -> their values for this mod). It is
@@ -448,24 +482,30 @@ def initData(self, progress, __attrgetters=attrgetter_cache):
                                        cell_rec.flags.isInterior else attrs)
                     for att in actual_attrs:
                         tempCellData[cfid][att] = __attrgetters[att](cell_rec)
+            src_masters = [m for m in srcInfo.masterNames if
+                           m in self.patchFile.all_plugins] # or break filter
+            for master in src_masters:
+                master_wanted_fids[master].update(tempCellData)
+            src_cell_data.append((tempCellData, attrs, interior_attrs,
+                                  src_masters))
+            progress.plus()
+        master_cells = {m: self._master_cells(m, wanted_fids) for
+                        m, wanted_fids in master_wanted_fids.items()}
+        for tempCellData, attrs, interior_attrs, src_masters in src_cell_data:
             # Add attribute values from record(s) in master file(s). Only adds
             # records where a matching formID is found in temp cell data. The
             # attribute values in temp cell data are then used to update these
             # records where the value is different.
-            for master in srcInfo.masterNames:
-                if not (masterFile := self.patchFile.get_loaded_mod(master)):
-                    continue # or break filter mods
-                for _sig, block in masterFile.iter_tops(self._read_sigs):
-                    for cfid, cell_rec in block.iter_present_records(b'CELL'):
-                        if cfid not in tempCellData: continue
-                        attrs1 = (interior_attrs
-                                  if cell_rec.flags and
-                                     cell_rec.flags.isInterior else attrs)
-                        for att in attrs1:
-                            master_attr = __attrgetters[att](cell_rec)
-                            if tempCellData[cfid][att] != master_attr:
-                                cellData[cfid][att] = tempCellData[cfid][att]
-            progress.plus()
+            for master in src_masters:
+                for cfid, cell_rec in master_cells[master].items():
+                    if cfid not in tempCellData: continue
+                    attrs1 = (interior_attrs
+                              if cell_rec.flags and
+                                 cell_rec.flags.isInterior else attrs)
+                    for att in attrs1:
+                        master_attr = __attrgetters[att](cell_rec)
+                        if tempCellData[cfid][att] != master_attr:
+                            cellData[cfid][att] = tempCellData[cfid][att]
 
     def _add_to_patch(self, rid, cell_wrld_block, top_sig):
         """Handle CELL and WRLD top blocks here."""
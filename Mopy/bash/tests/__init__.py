@@ -104,18 +104,32 @@ def iter_resources(resource_subfolder, filter_by_game=frozenset()):
     'skyrimse': 'Skyrim Special Edition (Steam)',
     'skyrimvr': 'Skyrim VR (Steam)',
 }
-# Cache for created and initialized GameInfos
+# Cache for created and initialized GameInfos, along with the subrecord header
+# format they use - some games (Morrowind) change it when initialized
 _game_cache = {}
+_sub_header_attrs = ('sub_header_fmt', 'sub_header_unpack', 'sub_header_size')
+_default_sub_header = None
 def set_game(gm_unique_display_name):
     """Hotswitches bush.game to the game with the specified resource subfolder
     name."""
+    global _default_sub_header
+    from ..brec import Subrecord
+    if _default_sub_header is None:
+        _default_sub_header = [getattr(Subrecord, a) for a in
+                               _sub_header_attrs]
     # noinspection PyProtectedMember
     try:
-        bush.game = _game_cache[gm_unique_display_name]
+        bush.game, sub_header = _game_cache[gm_unique_display_name]
     except KeyError:
         bush.game = new_game = bush._allGames[gm_unique_display_name]('')
+        for sub_attr, sub_val in zip(_sub_header_attrs, _default_sub_header):
+            setattr(Subrecord, sub_attr, sub_val) # undo other games' changes
         new_game.init()
-        _game_cache[gm_unique_display_name] = new_game
+        _game_cache[gm_unique_display_name] = new_game, [
+            getattr(Subrecord, a) for a in _sub_header_attrs]
+    else:
+        for sub_attr, sub_val in zip(_sub_header_attrs, sub_header):
+            setattr(Subrecord, sub_attr, sub_val)
 
 _wx_app = None
 
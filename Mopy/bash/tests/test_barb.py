@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+#
+# GPL License and Copyright Notice ============================================
+#  This file is part of Wrye Bash.
+#
+#  Wrye Bash is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  Wrye Bash is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Wrye Bash; if not, write to the Free Software Foundation,
+#  Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+#
+#  Wrye Bash copyright (C) 2005-2009 Wrye, 2010-2024 Wrye Bash Team
+#  https://github.com/wrye-bash
+#
+# =============================================================================
+import os
+
+from ..barb import _ChunkStore, _chunk_size, _chunks_dir_name, \
+    _incremental_ext, _write_manifest
+from ..bolt import GPath
+from ..wbtemp import TempDir
+
+def _chunk_names(backup_dir):
+    return {n for _r, _d, names in os.walk(backup_dir.join(_chunks_dir_name))
+            for n in names}
+
+def _read_files(root_dir):
+    files_data = {}
+    for root, _dirs, names in os.walk(root_dir):
+        for name in names:
+            file_path = os.path.join(root, name)
+            with open(file_path, 'rb') as ins:
+                files_data[os.path.relpath(file_path, root_dir).replace(
+                    os.sep, '/')] = ins.read()
+    return files_data
+
+def _backup(chunk_store, backup_dir, bak_name, files_data):
+    """Create an incremental backup of the specified files, mapping relative
+    paths to their contents."""
+    manifest_path = backup_dir.join(bak_name + _incremental_ext)
+    _write_manifest(manifest_path, {rel_path: chunk_store.add_bytes(data)
+                                    for rel_path, data in files_data.items()})
+    return manifest_path
+
+class Test_ChunkStore(object):
+    def test_round_trip(self):
+        files_data = {
+            'backup.dat': b'versions',
+            'My Games/Plugins.txt': b'Oblivion.esm\n',
+            # Spans two chunks, the first of which is shared with Copy.dat
+            'Bash Mod Data/Table.dat': b'a' * _chunk_size + b'tail',
+            'Bash Mod Data/Copy.dat': b'a' * _chunk_size,
+            'Empty.txt': b'',
+        }
+        with TempDir() as backup_dir, TempDir() as src_dir, \
+                TempDir() as out_dir:
+            backup_dir = GPath(backup_dir)
+            chunk_store = _ChunkStore(backup_dir)
+            # add_file and add_bytes must agree
+            src_file = GPath(src_dir).join('Table.dat')
+            with src_file.open('wb') as out:
+                out.write(files_data['Bash Mod Data/Table.dat'])
+            assert chunk_store.add_file(src_file) == chunk_store.add_bytes(
+                files_data['Bash Mod Data/Table.dat'])
+            manifest_path = _backup(chunk_store, backup_dir, 'Bak',
+                                    files_data)
+            # 'a' * _chunk_size, 'tail', 'versions' and Plugins.txt
+            assert len(_chunk_names(backup_dir)) == 4
+            chunk_store.restore(manifest_path, GPath(out_dir))
+            assert _read_files(out_dir) == files_data
+
+    def test_prune(self):
+        with TempDir() as backup_dir, TempDir() as out_dir:
+            backup_dir = GPath(backup_dir)
+            chunk_store = _ChunkStore(backup_dir)
+            old_backup = _backup(chunk_store, backup_dir, 'Old',
+                                 {'a.txt': b'shared', 'b.txt': b'old'})
+            new_backup = _backup(chunk_store, backup_dir, 'New',
+                                 {'a.txt': b'shared', 'b.txt': b'new'})
+            all_chunks = _chunk_names(backup_dir)
+            assert len(all_chunks) == 3
+            # Nothing to prune while both backups exist
+            chunk_store.prune()
+            assert _chunk_names(backup_dir) == all_chunks
+            # An unreadable manifest must not cost us the chunks of a backup
+            os.remove(old_backup)
+            broken_backup = backup_dir.join('Broken' + _incremental_ext)
+            with broken_backup.open('wb') as out:
+                out.write(b'not a manifest')
+            chunk_store.prune()
+            assert _chunk_names(backup_dir) == all_chunks
+            os.remove(broken_backup)
+            chunk_store.prune()
+            assert len(_chunk_names(backup_dir)) == 2
+            chunk_store.restore(new_backup, GPath(out_dir))
+            assert _read_files(out_dir) == {'a.txt': b'shared',
+                                            'b.txt': b'new'}
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+#
+# GPL License and Copyright Notice ============================================
+#  This file is part of Wrye Bash.
+#
+#  Wrye Bash is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  Wrye Bash is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Wrye Bash; if not, write to the Free Software Foundation,
+#  Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+#
+#  Wrye Bash copyright (C) 2005-2009 Wrye, 2010-2024 Wrye Bash Team
+#  https://github.com/wrye-bash
+#
+# =============================================================================
+import os
+
+from ... import bass, bush
+from ...basher.belt import WizInstallInfo, _AutoWryeParser, run_auto_wizards
+from ...bolt import FName, GPath
+from ...env import get_legacy_ws_game_info
+from ...wbtemp import TempDir
+
+_SELECT = '''\
+SelectOne "Pick a version", \\
+    "%sMain", "The main version", "", \\
+    "Alt", "The alternative version", ""
+    Case "Main"
+        SelectSubPackage "01 Main"
+        SelectPlugin "Main.esp"
+        Break
+    Case "Alt"
+        SelectSubPackage "02 Alt"
+        SelectPlugin "Alt.esp"
+        Break
+EndSelect
+'''
+_WIZARDS = {
+    'Defaults': _SELECT % '|' + 'RenamePlugin "Main.esp", "Renamed.esp"\n',
+    'No Defaults': _SELECT % '',
+    'Versions': 'RequireVersions "", "", "", "999.0"\n' + _SELECT % '|',
+}
+
+class _FakeInstaller(object):
+    is_archive = False
+    fileRootIdex = 0
+    extras_dict = {}
+    hasWizard = 'wizard.txt'
+
+    def __init__(self, fn_key, wizard_dir):
+        self.fn_key = FName(fn_key)
+        self._wizard_dir = wizard_dir
+        self.subNames = ['', '01 Main', '02 Alt']
+        self.espmMap = {'01 Main': [FName('Main.esp')],
+                        '02 Alt': [FName('Alt.esp')]}
+
+    def get_wizard_file_dir(self, progress, *, extract_images=True):
+        assert not extract_images
+        return self._wizard_dir
+
+class _CheckedAutoWryeParser(_AutoWryeParser):
+    """Fails on errors, which would make the wizard fall back to the dialog
+    too."""
+    def _page_error(self, title, msg):
+        raise AssertionError(f'{title} {msg}')
+
+def _fake_installers(temp_dir):
+    installers = []
+    for wiz_name, wiz_script in _WIZARDS.items():
+        wizard_dir = GPath(temp_dir).join(wiz_name)
+        wizard_dir.makedirs()
+        with wizard_dir.join('wizard.txt').open('w', encoding='utf-8') as out:
+            out.write(wiz_script)
+        installers.append(_FakeInstaller(wiz_name, wizard_dir))
+    return installers
+
+def test_auto_wizards():
+    old_settings, old_dirs = bass.settings, bass.dirs.copy()
+    old_ws_info = bush.ws_info
+    with TempDir() as temp_dir:
+        try:
+            bass.settings = {'bash.installers.autoWizard': True}
+            bush.ws_info = get_legacy_ws_game_info(bush.game)
+            # No game executable in there, so its version can't be met
+            bass.dirs['app'] = bass.dirs['mods'] = GPath(temp_dir)
+            installers = _fake_installers(temp_dir)
+            wiz_results = {}
+            for inst in installers:
+                parser = _CheckedAutoWryeParser(inst)
+                wiz_dir = inst.get_wizard_file_dir(None, extract_images=False)
+                assert parser.Begin(wiz_dir.join(inst.hasWizard),
+                                    wiz_dir) is None
+                wiz_results[str(inst.fn_key)] = parser.Continue()
+            # Only the first one may run without a wizard dialog - and none of
+            # them must create any pages
+            defaults_result = wiz_results.pop('Defaults')
+            assert isinstance(defaults_result, WizInstallInfo)
+            assert defaults_result.select_sub_packages == {'01 Main'}
+            assert defaults_result.select_plugins == {FName('Main.esp')}
+            assert defaults_result.rename_plugins == {
+                FName('Main.esp'): FName('Renamed.esp')}
+            assert defaults_result.should_install
+            assert wiz_results == {'No Defaults': True, 'Versions': True}
+            # Run them concurrently now
+            auto_results = {str(k): v for k, v in run_auto_wizards(
+                installers).items()}
+            assert auto_results.keys() == {'Defaults', 'No Defaults',
+                                           'Versions'}
+            assert auto_results['No Defaults'] is auto_results[
+                'Versions'] is None
+            defaults_auto = auto_results['Defaults']
+            assert (defaults_auto.select_sub_packages,
+                    defaults_auto.select_plugins,
+                    defaults_auto.rename_plugins) == (
+                defaults_result.select_sub_packages,
+                defaults_result.select_plugins,
+                defaults_result.rename_plugins)
+        finally:
+            bass.settings = old_settings
+            bush.ws_info = old_ws_info
+            bass.dirs.clear()
+            bass.dirs.update(old_dirs)
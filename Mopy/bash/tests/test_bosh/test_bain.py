@@ -23,7 +23,8 @@
 # =============================================================================
 import os
 
-from ...bosh.bain import _remove_empty_dirs
+from ...bolt import GPath, LowerDict, link_or_reflink, replace_hardlinked
+from ...bosh.bain import _DestIndex, _ExtractionCache, _remove_empty_dirs
 from ...wbtemp import TempDir
 
 def test__remove_empty_dirs():
@@ -33,3 +34,89 @@ def test__remove_empty_dirs():
         os.mkdir(os.path.join(cl, 'farmclothes02'))
         _remove_empty_dirs(tex)
         assert not os.path.exists(cl)
+
+def test_replace_hardlinked():
+    """Installing a file over one that was linked from a lower project must
+    not modify that project's file."""
+    with TempDir() as lower_proj, TempDir() as higher_proj, \
+            TempDir() as data_dir:
+        lower_src = os.path.join(lower_proj, 'textures', 'rock.dds')
+        higher_src = os.path.join(higher_proj, 'textures', 'rock.dds')
+        for src, contents in ((lower_src, b'lower'), (higher_src, b'higher')):
+            os.makedirs(os.path.dirname(src))
+            with open(src, 'wb') as out:
+                out.write(contents)
+        data_dest = os.path.join(data_dir, 'textures', 'rock.dds')
+        # Missing destinations are left to the regular copy
+        assert not replace_hardlinked(higher_src, data_dest)
+        assert not os.path.exists(data_dest)
+        link_or_reflink(lower_src, data_dest, allow_hardlink=True)
+        if os.stat(data_dest).st_nlink < 2: # reflinked, so nothing to do
+            assert not replace_hardlinked(higher_src, data_dest)
+            return
+        assert replace_hardlinked(higher_src, data_dest)
+        for path_, contents in ((data_dest, b'higher'), (lower_src, b'lower')):
+            with open(path_, 'rb') as ins:
+                assert ins.read() == contents
+        assert os.listdir(os.path.dirname(data_dest)) == ['rock.dds']
+        # Now it's a regular file that may be copied over
+        assert not replace_hardlinked(lower_src, data_dest)
+        with open(data_dest, 'rb') as ins:
+            assert ins.read() == b'higher'
+
+class _FakeInst:
+    def __init__(self, order, dests, is_active=True):
+        self.order = order
+        self.is_active = is_active
+        self.ci_dest_sizeCrc = LowerDict(dests)
+        self.dirty_sizeCrc = {}
+
+def test__DestIndex():
+    idx = _DestIndex()
+    low = _FakeInst(0, {'a.esp': (1, 1), 'Meshes\\b.nif': (2, 2)})
+    high = _FakeInst(1, {'A.esp': (1, 3)})
+    idx.rebuild([low, high])
+    assert idx.dest_installers('a.ESP') == {low: (1, 1), high: (1, 3)}
+    assert idx.winning_sizeCrc('a.esp') == (1, 3)
+    high.is_active = False
+    assert idx.winning_sizeCrc('a.esp') == (1, 1)
+    # reindexing only touches the changed paths
+    high.ci_dest_sizeCrc = LowerDict({'meshes\\B.nif': (2, 4)})
+    idx.index_installer(high)
+    assert idx.dest_installers('a.esp') == {low: (1, 1)}
+    assert idx.dest_installers('meshes\\b.nif') == {low: (2, 2),
+                                                      high: (2, 4)}
+    idx.drop_installer(low)
+    assert not idx.dest_installers('a.esp')
+    assert [d.lower() for d in idx.iter_dests()] == ['meshes\\b.nif']
+    # removed destinations are reported as changed, so stale underrides can
+    # be dropped
+    assert {d.lower() for d in idx.pop_changed_dests()} == {
+        'a.esp', 'meshes\\b.nif'}
+    assert not idx.pop_changed_dests()
+    high.dirty_sizeCrc = {'meshes\\b.nif': (2, 2)}
+    idx.index_installer(high)
+    assert idx.dirty_installers() == {high}
+    high.dirty_sizeCrc = {}
+    assert not idx.dirty_installers()
+
+def test__ExtractionCache():
+    with TempDir() as cache_dir, TempDir() as src_dir, TempDir() as out_dir:
+        member_crcs = {'a.esp': 1, 'b.esp': 2, 'c.esp': 3, 'big.bsa': 4}
+        for member, member_size in (('a.esp', 40), ('b.esp', 40),
+                                    ('c.esp', 40), ('big.bsa', 200)):
+            with open(os.path.join(src_dir, member), 'wb') as out:
+                out.write(b'x' * member_size)
+        cache = _ExtractionCache(GPath(cache_dir))
+        cache.store(1, member_crcs, ['a.esp', 'b.esp'], src_dir, 100)
+        # the least recently used file is evicted to make room for c.esp and
+        # big.bsa is skipped, since it can never fit
+        cache.store(1, member_crcs, ['c.esp', 'big.bsa'], src_dir, 100)
+        missing = cache.fetch(1, member_crcs, [*member_crcs], out_dir)
+        assert missing == ['a.esp', 'big.bsa']
+        assert sorted(os.listdir(out_dir)) == ['b.esp', 'c.esp']
+        assert sorted(os.listdir(os.path.join(cache_dir, '00000001'))) == [
+            'b.esp', 'c.esp']
+        # a changed member crc invalidates the cached file
+        assert cache.fetch(1, {**member_crcs, 'b.esp': 5}, ['b.esp'],
+                           out_dir) == ['b.esp']
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+#
+# GPL License and Copyright Notice ============================================
+#  This file is part of Wrye Bash.
+#
+#  Wrye Bash is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  Wrye Bash is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Wrye Bash; if not, write to the Free Software Foundation,
+#  Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+#
+#  Wrye Bash copyright (C) 2005-2009 Wrye, 2010-2024 Wrye Bash Team
+#  https://github.com/wrye-bash
+#
+# =============================================================================
+from itertools import product
+
+from ...bosh.bsa_files import _ba2_dds_header
+from ...bosh.dds_files import DDSFile, _DXGIFormat, mk_dxgi_fmt
+
+def _old_dds_file(dxgi_fmt_index, height, width, num_mips, is_cube_map,
+                  dds_data):
+    """Build a DDS file for a DX10 BA2 texture the way BA2.extract_assets
+    used to, before the headers got cached."""
+    dds_file = DDSFile('')
+    dds_file.dds_header.dw_height = height
+    dds_file.dds_header.dw_width = width
+    dds_file.dds_header.dw_mip_map_count = num_mips
+    dds_file.dds_header.dw_depth = 1
+    dds_file.dds_dxt10.resource_dimension = 3
+    dds_file.dds_dxt10.array_size = 1
+    if is_cube_map:
+        dds_file.dds_header.dw_caps.DDSCAPS_COMPLEX = True
+        dds_file.dds_header.dw_caps2 = 0xFE00
+        dds_file.dds_dxt10.misc_flag = 0x4
+    mk_dxgi_fmt(dxgi_fmt_index).setup_file(dds_file, use_legacy_formats=True)
+    dds_file.dds_contents = dds_data
+    return dds_file.dump_file()
+
+def test__ba2_dds_header():
+    fmt_names = {f._fmt_name: i for i, f in _DXGIFormat.index_to_fmt.items()}
+    # Compressed, legacy uncompressed and DXT10-only formats
+    dxgi_fmts = [fmt_names[n] for n in (
+        'DXGI_FORMAT_BC1_UNORM', 'DXGI_FORMAT_BC3_UNORM',
+        'DXGI_FORMAT_BC5_UNORM', 'DXGI_FORMAT_BC7_UNORM',
+        'DXGI_FORMAT_BC7_UNORM_SRGB', 'DXGI_FORMAT_R8G8B8A8_UNORM',
+        'DXGI_FORMAT_B8G8R8A8_UNORM', 'DXGI_FORMAT_R8_UNORM',
+        'DXGI_FORMAT_R16G16B16A16_FLOAT')]
+    dds_data = b'\x01\x02\x03\x04' * 8
+    _ba2_dds_header.cache_clear()
+    for dds_key in product(dxgi_fmts, (1, 4, 512, 1000), (4, 256, 2048),
+                           (1, 10), (False, True)):
+        expected = _old_dds_file(*dds_key, dds_data)
+        # The second header comes from the cache
+        for _i in range(2):
+            assert _ba2_dds_header(*dds_key) + dds_data == expected
+    assert _ba2_dds_header.cache_info().hits == 432
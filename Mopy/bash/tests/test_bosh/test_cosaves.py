@@ -244,6 +244,7 @@ def _process_cosave(curr_cosave: xSECosave):
             curr_cosave.read_cosave()
             for pchunk in curr_cosave.cosave_chunks:
                 for cchunk in pchunk.chunks:
+                    cchunk = cchunk.decode_chunk()
                     if self._wants_chunk(cchunk):
                         map_func(cchunk)
         map_xse_cosaves(_process_cosave)
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+#
+# GPL License and Copyright Notice ============================================
+#  This file is part of Wrye Bash.
+#
+#  Wrye Bash is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  Wrye Bash is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Wrye Bash; if not, write to the Free Software Foundation,
+#  Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+#
+#  Wrye Bash copyright (C) 2005-2009 Wrye, 2010-2024 Wrye Bash Team
+#  https://github.com/wrye-bash
+#
+# =============================================================================
+import io
+import random
+import struct
+import zlib
+
+from ...bolt import FName
+from ...bosh.save_headers import SkyrimSaveHeader
+
+def _str16(bstr):
+    return struct.pack('<H', len(bstr)) + bstr
+
+def _sse_zlib_save(masters, body):
+    """Build a minimal zlib-compressed Skyrim SE save with the specified
+    masters, followed by the six file location table offsets and body."""
+    header = (struct.pack('<2I', 12, 1) + _str16(b'Player') +
+              struct.pack('<I', 1) + _str16(b'Riverwood') +
+              _str16(b'0.1.0') + _str16(b'NordRace') +
+              struct.pack('<H2fQ2I', 0, 0.0, 0.0, 0, 0, 0) + # no screenshot
+              struct.pack('<H', 1)) # zlib compression
+    master_table = bytes([len(masters)]) + b''.join(map(_str16, masters))
+    decompressed = (bytes([74]) + # form version, no ESL master block
+                    struct.pack('<I', len(master_table)) + master_table +
+                    struct.pack('<6I', *range(100, 106)) + body)
+    compressed = zlib.compress(decompressed, 1)
+    return (SkyrimSaveHeader.save_magic + struct.pack('<I', len(header)) +
+            header + struct.pack('<2I', len(decompressed), len(compressed)) +
+            compressed)
+
+def test__stream_recompress():
+    """Remapping the masters of a zlib-compressed save by streaming it must
+    produce the same save as doing it all in memory."""
+    rng = random.Random(0)
+    # Big enough to span several stream windows, compressible like a save
+    body = b''.join(rng.choice((b'\x00' * 64, rng.randbytes(64))) for _x in
+                    range(0x30000))
+    save_data = _sse_zlib_save([b'Skyrim.esm', b'Old.esp'], body)
+    results = []
+    for recompress in ('_stream_recompress', '_memory_recompress'):
+        save_header = SkyrimSaveHeader(None, ins=io.BytesIO(save_data))
+        assert save_header.masters == (FName('Skyrim.esm'), FName('Old.esp'))
+        save_header.remap_masters({FName('Old.esp'): FName('New Name.esp')})
+        save_header._encode_masters()
+        ins, out = io.BytesIO(save_data), io.BytesIO()
+        out.write(ins.read(save_header._sse_start))
+        decompressed_size, compressed_size = struct.unpack('<2I', ins.read(8))
+        getattr(save_header, recompress)(ins, out, compressed_size,
+                                         decompressed_size)
+        results.append(out.getvalue())
+    streamed, in_memory = results
+    assert streamed == in_memory
+    # The rewritten save reads back fine, with the new masters and body and
+    # the file location table shifted by the longer master name
+    remapped = SkyrimSaveHeader(None, ins=io.BytesIO(streamed))
+    assert remapped.masters == (FName('Skyrim.esm'), FName('New Name.esp'))
+    decompressed = zlib.decompress(streamed[remapped._sse_start + 8:])
+    assert decompressed.endswith(struct.pack('<6I', *range(105, 111)) + body)
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+#
+# GPL License and Copyright Notice ============================================
+#  This file is part of Wrye Bash.
+#
+#  Wrye Bash is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  Wrye Bash is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Wrye Bash; if not, write to the Free Software Foundation,
+#  Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+#
+#  Wrye Bash copyright (C) 2005-2009 Wrye, 2010-2024 Wrye Bash Team
+#  https://github.com/wrye-bash
+#
+# =============================================================================
+import os
+import struct
+
+from .. import set_game
+from ...bolt import FName, GPath
+from ...bosh._saves import SaveFile, scan_saves_bloating
+from ...bosh.save_headers import OblivionSaveHeader
+from ...wbtemp import TempDir
+
+class _FakeSaveInfo:
+    def __init__(self, save_path):
+        self.abs_path = GPath(save_path)
+        self.fn_key = FName(os.path.basename(save_path))
+        self.fsize = os.path.getsize(save_path)
+
+def _str8(bstr):
+    return bytes([len(bstr)]) + bstr
+
+def _str8_list(masters):
+    return bytes([len(masters)]) + b''.join(map(_str8, masters))
+
+def _block16(bstr):
+    return struct.pack('<H', len(bstr)) + bstr
+
+def _created_record(rec_sig, rec_fid, full):
+    rec_data = b'EDID' + _block16(b'Created\x00')
+    if full:
+        rec_data += b'FULL' + _block16(full)
+    return (rec_sig + struct.pack('<4I', len(rec_data), 0, rec_fid, 0) +
+            rec_data)
+
+def _oblivion_save(created, change_records, fids):
+    """Build a minimal Oblivion save with the specified created records,
+    change records ((formid, kind, flags, data) tuples) and FormID table."""
+    header = (b'\x00\x7d' + b'\x00' * 16 + struct.pack('<3I', 0, 0, 1) +
+              _str8(b'Player\x00') + struct.pack('<H', 1) +
+              _str8(b'Cyrodiil\x00') + struct.pack('<fI', 0.0, 0) +
+              b'\x00' * 16 + struct.pack('<3I', 0, 0, 0) + # no screenshot
+              _str8_list([b'Oblivion.esm', b'Bloated.esp']))
+    body = b'\x00' * 32 + struct.pack('<H', 0) # pre-globals, no globals
+    body += b''.join(_block16(b'\x00' * 4) for _x in range(4)) + b'\x00' * 4
+    body += struct.pack('<I', len(created)) + b''.join(created)
+    body += b''.join(_block16(b'') for _x in range(4)) # pre-records
+    body += b''.join(struct.pack('=IBIBH', rec_id, rec_kind, rec_flgs, 0,
+        len(rec_data)) + rec_data for rec_id, rec_kind, rec_flgs, rec_data
+                     in change_records)
+    body += struct.pack('<I', 0) # no temp effects
+    # Fill in the FormID table pointer, relative to the start of the save
+    fids_pos = (len(OblivionSaveHeader.save_magic) + len(header) + 8 +
+                len(body))
+    body += struct.pack('<I', len(fids)) + struct.pack(f'<{len(fids)}I',
+                                                       *fids)
+    body += struct.pack('<I', 0) # no worldspaces
+    return (OblivionSaveHeader.save_magic + header +
+            struct.pack('<2I', fids_pos, len(change_records)) + body)
+
+def test_scan_bloating():
+    """scan_bloating must find the same bloat as load() + findBloating."""
+    set_game('Oblivion (Steam)')
+    created = [_created_record(b'SPEL', 0xFF000000 + i, full) for i, full in
+        enumerate([b'Bloat\x00'] * 60 + [b'Rare\x00'] * 10 + [b''] * 5)]
+    created += [_created_record(b'ALCH', 0xFF001000 + i, full) for i, full in
+        enumerate([b'Potion\x00'] * 120 + [b'Brew\x00'] * 80)]
+    fids = [0x14, 0, 0x0100ABCD, 0]
+    change_records = [
+        # created references - two of them point at null FormIDs
+        (0xFF000100, 49, 2, struct.pack('<2I', 0, 1)),
+        (0xFF000101, 49, 2, struct.pack('<2I', 0, 3)),
+        (0xFF000102, 49, 2, struct.pack('<2I', 0, 2)),
+        (0xFF000103, 49, 2, struct.pack('<2I', 0, 0xFF000001)),
+        # not created or without the baseid flag - never null refs
+        (0x00000104, 49, 2, struct.pack('<2I', 0, 1)),
+        (0xFF000105, 49, 0, struct.pack('<2I', 0, 1)),
+        (0x00000007, 35, 0, b'\x00' * 12),
+    ]
+    with TempDir() as save_dir:
+        save_path = os.path.join(save_dir, 'Bloated.ess')
+        with open(save_path, 'wb') as out:
+            out.write(_oblivion_save(created, change_records, fids))
+        save_inf = _FakeSaveInfo(save_path)
+        loaded = SaveFile(save_inf)
+        loaded.load()
+        expected = loaded.findBloating()
+        assert expected == ({(b'SPEL', 'Bloat'): 60,
+                             (b'ALCH', 'Potion'): 120}, 2)
+        assert SaveFile(save_inf, canSave=False).scan_bloating() == expected
+        results, errors = scan_saves_bloating([save_inf])
+        assert results == {save_inf.fn_key: expected} and not errors
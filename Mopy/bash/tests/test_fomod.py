@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+#
+# GPL License and Copyright Notice ============================================
+#  This file is part of Wrye Bash.
+#
+#  Wrye Bash is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  Wrye Bash is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Wrye Bash; if not, write to the Free Software Foundation,
+#  Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+#
+#  Wrye Bash copyright (C) 2005-2009 Wrye, 2010-2024 Wrye Bash Team
+#  https://github.com/wrye-bash
+#
+# =============================================================================
+from .. import fomod
+from ..bolt import GPath
+from ..fomod import FomodInstaller, _FileListIndex, _max_parsed_configs, \
+    _parsed_configs
+from ..wbtemp import TempDir
+
+_FILE_LIST = [
+    'Foo - A/b.esp',
+    'foo\\Textures\\a.dds',
+    'Readme.txt',
+    'Foo/a.esp',
+    'Foo - A\\c.esp',
+    'FOO/Meshes\\b.nif',
+    'foo',
+    'Foobar/x.esp',
+    'Foo.esp',
+]
+
+def _find_files_naive(file_list, source_lower):
+    """What _FileListIndex replaced - check every file in the package."""
+    source_starts = (source_lower + '/', source_lower + '\\')
+    return [f for f in file_list if f.lower() == source_lower or
+            f.lower().startswith(source_starts)]
+
+def test_find_files():
+    file_index = _FileListIndex(_FILE_LIST)
+    # An exact file
+    assert file_index.find_files('readme.txt') == ['Readme.txt']
+    assert file_index.find_files('foo.esp') == ['Foo.esp']
+    # A folder, using both separators - and a file with the same name
+    assert file_index.find_files('foo') == [
+        'foo\\Textures\\a.dds', 'Foo/a.esp', 'FOO/Meshes\\b.nif', 'foo']
+    # Foo must not match Foo - A and Foobar, but Foo - A must be found
+    assert file_index.find_files('foo - a') == [
+        'Foo - A/b.esp', 'Foo - A\\c.esp']
+    # Subfolders
+    assert file_index.find_files('foo/meshes') == ['FOO/Meshes\\b.nif']
+    assert file_index.find_files('foo\\textures') == ['foo\\Textures\\a.dds']
+    # Nothing to find
+    assert file_index.find_files('fo') == []
+    assert file_index.find_files('missing.esp') == []
+    assert _FileListIndex([]).find_files('foo') == []
+    for source_lower in ('foo', 'foo - a', 'foobar', 'foo.esp', 'readme.txt',
+                         'foo/meshes', 'foo - a/b.esp', ''):
+        assert file_index.find_files(source_lower) == _find_files_naive(
+            _FILE_LIST, source_lower)
+
+_MODULE_CONFIG = '''\
+<config xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" \
+xsi:noNamespaceSchemaLocation="http://qconsulting.ca/fo3/ModConfig5.0.xsd">
+    <moduleName>Test Mod</moduleName>
+</config>
+'''
+
+def test_parsed_config_cache():
+    old_configs = _parsed_configs.copy()
+    _parsed_configs.clear()
+    try:
+        with TempDir() as temp_dir:
+            mc_path = GPath(temp_dir).join('ModuleConfig.xml')
+            with mc_path.open('w', encoding='utf-8') as out:
+                out.write(_MODULE_CONFIG)
+            def _fomod(config_key):
+                return FomodInstaller(mc_path, [], GPath(''), GPath(''),
+                                      '1.0', config_key)
+            # Archives with the same key share the config and its validation
+            first, second = _fomod((1, 2)), _fomod((1, 2))
+            assert first.fomod_name == 'Test Mod'
+            assert first.fomod_tree is second.fomod_tree
+            assert first._parsed_config is second._parsed_config
+            assert first.try_validate()[0]
+            if fomod._can_validate:
+                assert first._parsed_config.validation is not None
+                assert first.try_validate() is second.try_validate()
+            # Projects get parsed every time and are not cached
+            proj_first, proj_second = _fomod(None), _fomod(None)
+            assert proj_first.fomod_tree is not proj_second.fomod_tree
+            assert proj_first.fomod_tree is not first.fomod_tree
+            assert list(_parsed_configs) == [(1, 2)]
+            # Fill the cache up, then reuse the oldest config - the second
+            # oldest one has to go once there is one more config
+            dropped_tree = _fomod((1, 0)).fomod_tree
+            for crc in range(2, _max_parsed_configs):
+                _fomod((crc, 0))
+            assert len(_parsed_configs) == _max_parsed_configs
+            assert _fomod((1, 2)).fomod_tree is first.fomod_tree
+            _fomod((_max_parsed_configs, 0))
+            assert list(_parsed_configs) == [
+                *((crc, 0) for crc in range(2, _max_parsed_configs)), (1, 2),
+                (_max_parsed_configs, 0)]
+            assert _fomod((1, 0)).fomod_tree is not dropped_tree
+    finally:
+        _parsed_configs.clear()
+        _parsed_configs.update(old_configs)
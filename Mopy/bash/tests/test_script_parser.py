@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+#
+# GPL License and Copyright Notice ============================================
+#  This file is part of Wrye Bash.
+#
+#  Wrye Bash is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  Wrye Bash is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Wrye Bash; if not, write to the Free Software Foundation,
+#  Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+#
+#  Wrye Bash copyright (C) 2005-2009 Wrye, 2010-2024 Wrye Bash Team
+#  https://github.com/wrye-bash
+#
+# =============================================================================
+from ..ScriptParser import PreParser
+from ..bolt import GPath
+from ..wbtemp import TempDir
+
+_WIZARD = '''\
+i = 0
+While i < 3
+    last = i
+    If i > 0
+        Note "prev " + prev
+    EndIf
+    If i == 0
+        name = "Alpha"
+    Else
+        name += "b"
+    EndIf
+    lowered = name.lower()
+    j = 0
+    While j <= i
+        j += 1
+        If j == 2
+            Continue
+        EndIf
+        Note lowered + str(j) + str(lowered.len())
+    EndWhile
+    prev = name
+    i += 1
+EndWhile
+Note str(last) + str(name.lower().find("b"))
+'''
+
+class _NoCache(dict):
+    """Drops everything stored in it, so that nothing gets replayed."""
+    def __setitem__(self, key, value): pass
+
+class _TestParser(PreParser):
+    def run(self, wizard_file):
+        assert self.Begin(wizard_file, wizard_file.head) is None
+        while self.cLine < len(self.lines):
+            self.RunLine(self.lines[self.cLine])
+        return dict(self.variables), self.notes
+
+class _UncachedParser(_TestParser):
+    def _use_compiled_script(self, script_crc):
+        self._compiled_lines = _NoCache()
+        self._compiled_rpns = _NoCache()
+
+def test_compiled_replay():
+    with TempDir() as temp_dir:
+        wizard_file = GPath(temp_dir).join('wizard.txt')
+        with wizard_file.open('w', encoding='utf-8') as out:
+            out.write(_WIZARD)
+        expected = _UncachedParser().run(wizard_file)
+        assert expected == ({'i': 3, 'last': 2, 'name': 'Alphabb',
+                             'lowered': 'alphabb', 'j': 3, 'prev': 'Alphabb'},
+                            ['- alpha15\n', '- prev Alpha\n', '- alphab16\n',
+                             '- prev Alphab\n', '- alphabb17\n',
+                             '- alphabb37\n', '- 25\n'])
+        parser = _TestParser()
+        # The first run compiles the script, the second one and a fresh
+        # parser replay it
+        assert parser.run(wizard_file) == expected
+        assert parser._compiled_lines and parser._compiled_rpns
+        assert parser.run(wizard_file) == expected
+        assert _TestParser().run(wizard_file) == expected